@@ -56,7 +56,8 @@ install_system_packages() {
 
     log_info "Installing audio/TTS packages..."
     apt-get install -y \
-        espeak-ng
+        espeak-ng \
+        python3-alsaaudio
 
     log_info "Installing Tailscale (remote support)..."
     if ! command -v tailscale &>/dev/null; then
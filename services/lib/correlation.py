@@ -18,8 +18,11 @@ For outgoing HTTP requests, add the header::
     session.post(url, headers=correlation_headers())
 """
 
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 import time
 from contextvars import ContextVar
 
@@ -35,6 +38,9 @@ _cid: ContextVar[str] = ContextVar("cid", default="-")
 
 HEADER = "X-Correlation-ID"
 
+# Background writer when install_logging(queued=True) is in effect.
+_listener: logging.handlers.QueueListener | None = None
+
 
 def new_id() -> str:
     """Generate a short (5-char) correlation ID."""
@@ -118,12 +124,26 @@ async def correlation_middleware(request: web.Request, handler):
             response.headers[HEADER] = cid
 
 
-def install_logging(name: str, level=logging.INFO) -> logging.Logger:
+def _stop_listener() -> None:
+    """Flush and stop the queued-logging writer thread, if running."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def install_logging(name: str, level=logging.INFO, queued: bool = False) -> logging.Logger:
     """Configure structured logging with correlation IDs.
 
     Replaces basicConfig — call once at service startup.
     Returns the named logger for convenience.
+
+    With ``queued=True`` records are handed to a background thread that
+    does the stream write, so services logging on a latency-sensitive
+    thread (masterlink's USB reader) don't block on stderr.  The
+    correlation ID is still captured in the emitting thread.
     """
+    global _listener
     fmt = "[%(asctime)s] %(levelname)s [%(cid)s] %(message)s"
     datefmt = "%Y-%m-%d %H:%M:%S"
 
@@ -133,9 +153,17 @@ def install_logging(name: str, level=logging.INFO) -> logging.Logger:
     # Remove existing handlers (from prior basicConfig calls)
     for h in root.handlers[:]:
         root.removeHandler(h)
+    _stop_listener()
 
     handler = logging.StreamHandler()
     handler.setFormatter(logging.Formatter(fmt, datefmt=datefmt))
+    if queued:
+        log_queue = queue.SimpleQueue()
+        _listener = logging.handlers.QueueListener(log_queue, handler)
+        _listener.start()
+        atexit.unregister(_stop_listener)
+        atexit.register(_stop_listener)
+        handler = logging.handlers.QueueHandler(log_queue)
     handler.addFilter(_CorrelationFilter())
     root.addHandler(handler)
 
@@ -3,14 +3,28 @@
 import asyncio
 import hashlib
 import logging
+import os
 import shutil
 import time
+from collections import OrderedDict
 from pathlib import Path
 
 from .constants import PASSTHROUGH_SETS, TRANSCODE_CODECS
 
 log = logging.getLogger('beo-usb')
 
+# Prefetch admission: never run more than a few background transcodes at
+# once, and never prefetch into a full cache whose oldest entry was played
+# recently — that would evict a file that is about to be requested again.
+PREFETCH_CONCURRENCY = 3
+PREFETCH_HOT_WINDOW = 60.0  # seconds
+
+# Files ffmpeg failed on are not retried until the entry expires (e.g. the
+# USB stick was remounted), so a corrupt file doesn't re-fork ffmpeg on
+# every UI event.
+FAILED_CACHE_SIZE = 256
+FAILED_CACHE_TTL = 300.0  # seconds
+
 
 class TranscodeCache:
     """On-the-fly audio transcoding with RAM/SSD caching.
@@ -21,9 +35,18 @@ class TranscodeCache:
     def __init__(self, target_format='mp3', max_bytes=300 * 1024 * 1024):
         self.target_format = target_format
         self.max_bytes = max_bytes
+        self._passthrough = frozenset(
+            PASSTHROUGH_SETS.get(target_format, PASSTHROUGH_SETS['mp3']))
         self._cache_dir = None
         self._lock = asyncio.Lock()
         self._active_transcodes = {}  # path -> asyncio.Event (signals completion)
+        self._prefetch_sem = asyncio.Semaphore(PREFETCH_CONCURRENCY)
+        self._failed = OrderedDict()  # path -> monotonic time of failure
+        # LRU of cached outputs, oldest first: cached path -> (size, last used).
+        # The cache dir is wiped on init, so this is the whole picture and
+        # eviction never has to stat the directory.
+        self._lru = OrderedDict()
+        self._total_bytes = 0
 
     def init(self):
         """Set up cache directory. Prefer tmpfs, fall back to /tmp."""
@@ -44,20 +67,54 @@ class TranscodeCache:
     def _cached_path(self, file_path):
         return self._cache_dir / f"{self._cache_key(file_path)}.{self.target_format}"
 
+    def _record(self, cached, size):
+        """Add a freshly transcoded output to the LRU."""
+        old = self._lru.pop(cached, None)
+        if old:
+            self._total_bytes -= old[0]
+        self._lru[cached] = (size, time.monotonic())
+        self._total_bytes += size
+
+    def _touch(self, cached):
+        """Mark a cached output as most recently used."""
+        entry = self._lru.get(cached)
+        if entry:
+            self._lru[cached] = (entry[0], time.monotonic())
+            self._lru.move_to_end(cached)
+
     def needs_transcode(self, file_path):
         """Check if a file needs transcoding for the target player."""
-        ext = Path(file_path).suffix.lower()
-        return ext not in PASSTHROUGH_SETS.get(self.target_format, PASSTHROUGH_SETS['mp3'])
+        return os.path.splitext(file_path)[1].lower() not in self._passthrough
+
+    def _recently_failed(self, file_path):
+        failed_at = self._failed.get(file_path)
+        if failed_at is None:
+            return False
+        if time.monotonic() - failed_at > FAILED_CACHE_TTL:
+            del self._failed[file_path]
+            return False
+        return True
+
+    def _mark_failed(self, file_path):
+        self._failed[file_path] = time.monotonic()
+        self._failed.move_to_end(file_path)
+        if len(self._failed) > FAILED_CACHE_SIZE:
+            self._failed.popitem(last=False)
 
     async def get_or_transcode(self, file_path):
-        """Return path to a streamable file. Transcodes WMA->FLAC if needed."""
+        """Return path to a streamable file. Transcodes WMA->FLAC if needed.
+
+        Returns None if the transcode failed (now or within FAILED_CACHE_TTL).
+        """
         if not self.needs_transcode(file_path):
             return file_path
+        if self._recently_failed(file_path):
+            log.debug("Skipping recently failed transcode: %s", Path(file_path).name)
+            return None
 
         cached = self._cached_path(file_path)
         if cached.is_file():
-            # Touch for LRU
-            cached.touch()
+            self._touch(str(cached))
             return str(cached)
 
         # Check under lock whether someone else is already transcoding this file
@@ -68,7 +125,7 @@ class TranscodeCache:
             else:
                 # Re-check cache after acquiring lock
                 if cached.is_file():
-                    cached.touch()
+                    self._touch(str(cached))
                     return str(cached)
                 # Claim the transcode slot
                 pending_event = None
@@ -84,52 +141,103 @@ class TranscodeCache:
 
         # Transcode outside lock
         try:
-            await self._transcode(file_path, str(cached))
-            await self._evict_if_needed()
-            return str(cached) if cached.is_file() else None
+            size = await self._transcode(file_path, str(cached))
+            if size is not None:
+                self._record(str(cached), size)
+                await self._evict_if_needed()
+                return str(cached)
+            # Don't leave a truncated output behind to be served as a cache hit
+            cached.unlink(missing_ok=True)
+            self._mark_failed(file_path)
+            return None
         finally:
             event.set()
             self._active_transcodes.pop(file_path, None)
 
     async def _transcode(self, input_path, output_path):
-        """Run ffmpeg to transcode to the target format (mp3 or flac)."""
+        """Run ffmpeg to transcode to the target format (mp3 or flac).
+
+        Returns the output size in bytes, or None on failure.
+        """
         codec_args = TRANSCODE_CODECS.get(self.target_format, TRANSCODE_CODECS['mp3'])
         log.info("Transcoding -> %s: %s", self.target_format, Path(input_path).name)
         start = time.monotonic()
+        # ffmpeg is quiet except for errors; only capture those when debugging
+        # so a successful transcode doesn't need a stderr reader at all.
+        debug = log.isEnabledFor(logging.DEBUG)
         proc = await asyncio.create_subprocess_exec(
-            'ffmpeg', '-y', '-i', input_path,
+            'ffmpeg', '-y', '-nostats', '-loglevel', 'error', '-i', input_path,
             *codec_args, output_path,
             stdout=asyncio.subprocess.DEVNULL,
-            stderr=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE if debug else asyncio.subprocess.DEVNULL,
         )
         _, stderr = await proc.communicate()
         elapsed = time.monotonic() - start
         if proc.returncode == 0:
-            size = Path(output_path).stat().st_size / (1024 * 1024)
-            log.info("Transcoded in %.1fs (%.1fMB): %s", elapsed, size, Path(input_path).name)
+            size = os.stat(output_path).st_size
+            log.info("Transcoded in %.1fs (%.1fMB): %s", elapsed, size / (1024 * 1024),
+                     Path(input_path).name)
+            return size
+        if stderr:
+            log.error("Transcode failed (%d): %s", proc.returncode,
+                      stderr[-2048:].decode(errors='replace').strip())
         else:
-            log.error("Transcode failed (%d): %s", proc.returncode, stderr.decode()[-200:])
+            log.error("Transcode failed (%d): %s (enable debug logging for ffmpeg output)",
+                      proc.returncode, Path(input_path).name)
+        return None
 
     async def _evict_if_needed(self):
         """LRU eviction if cache exceeds max size."""
-        if not self._cache_dir:
+        # Never evict the newest entry: it was just transcoded for a caller
+        victims = []
+        freed = 0
+        while self._total_bytes > self.max_bytes and len(self._lru) > 1:
+            victim, (size, _) = self._lru.popitem(last=False)
+            self._total_bytes -= size
+            freed += size
+            victims.append(victim)
+        if not victims:
             return
-        files = sorted(self._cache_dir.glob(f"*.{self.target_format}"), key=lambda f: f.stat().st_mtime)
-        total = sum(f.stat().st_size for f in files)
-        while total > self.max_bytes and files:
-            victim = files.pop(0)
-            total -= victim.stat().st_size
-            victim.unlink(missing_ok=True)
-            log.info("Evicted from cache: %s", victim.name)
+        for victim in victims:
+            try:
+                os.unlink(victim)
+            except FileNotFoundError:
+                pass
+        log.info("Evicted %d file(s) from cache (%.1fMB)", len(victims), freed / (1024 * 1024))
+
+    def _cache_is_hot(self):
+        """True if the cache is full and its LRU victim was used recently."""
+        if self._total_bytes < self.max_bytes or not self._lru:
+            return False
+        _, last_used = next(iter(self._lru.values()))
+        return last_used > time.monotonic() - PREFETCH_HOT_WINDOW
+
+    async def _prefetch_one(self, file_path):
+        async with self._prefetch_sem:
+            # State may have changed while queued behind the semaphore
+            if file_path in self._active_transcodes or self._cached_path(file_path).is_file():
+                return
+            if self._cache_is_hot():
+                log.debug("Prefetch skipped (cache full of recent files): %s",
+                          Path(file_path).name)
+                return
+            await self.get_or_transcode(file_path)
 
     async def prefetch(self, file_paths):
-        """Pre-transcode a list of files in the background."""
+        """Pre-transcode upcoming files in the background.
+
+        At most PREFETCH_CONCURRENCY transcodes run at a time, in list order;
+        the rest wait their turn rather than all spawning ffmpeg at once.
+        """
         for fp in file_paths:
-            if self.needs_transcode(fp):
+            if (self.needs_transcode(fp) and fp not in self._active_transcodes
+                    and not self._recently_failed(fp)):
                 cached = self._cached_path(fp)
                 if not cached.is_file():
-                    asyncio.create_task(self.get_or_transcode(fp))
+                    asyncio.create_task(self._prefetch_one(fp))
 
     def cleanup(self):
         if self._cache_dir and self._cache_dir.exists():
             shutil.rmtree(self._cache_dir, ignore_errors=True)
+        self._lru.clear()
+        self._total_bytes = 0
@@ -9,10 +9,26 @@ import asyncio
 import json
 import logging
 
-from aiohttp import web
+from aiohttp import WSMsgType, web
 
 logger = logging.getLogger("beo-router")
 
+# Media updates carry base64 artwork, so the broadcast encode is a few
+# hundred KB of JSON; orjson does that several times faster when present.
+# Payloads are encoded to UTF-8 once and sent as pre-encoded text frames,
+# rather than send_str() re-encoding the same string for every client.
+try:
+    import orjson
+
+    def _encode(obj) -> bytes:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:  # e.g. non-str keys — let the stdlib handle it
+            return json.dumps(obj).encode()
+except ImportError:
+    def _encode(obj) -> bytes:
+        return json.dumps(obj).encode()
+
 # Per-client send timeout: a hung or dropped TCP connection must not be
 # able to block the broadcast loop (and therefore every other WS client).
 _WS_SEND_TIMEOUT = 2.0
@@ -46,8 +62,8 @@ class MediaState:
 
     # ── WebSocket broadcast ──
 
-    async def _send_all(self, msg: str) -> None:
-        """Send ``msg`` to every WS client with a per-client timeout.
+    async def _send_all(self, payload: bytes) -> None:
+        """Send encoded JSON ``payload`` to every WS client with a timeout.
 
         Sends run concurrently so N hung clients cost one timeout window
         total, not one each — awaited broadcasts sit on the event routing
@@ -61,7 +77,8 @@ class MediaState:
         async def _send_one(ws: web.WebSocketResponse) -> web.WebSocketResponse | None:
             """Return the client if it should be dropped, else None."""
             try:
-                await asyncio.wait_for(ws.send_str(msg), timeout=_WS_SEND_TIMEOUT)
+                await asyncio.wait_for(ws.send_frame(payload, WSMsgType.TEXT),
+                                       timeout=_WS_SEND_TIMEOUT)
                 return None
             except asyncio.TimeoutError:
                 logger.warning("WS client send timed out — dropping client")
@@ -86,13 +103,13 @@ class MediaState:
         """Push any event to all connected UI WebSocket clients."""
         if not self._ws_clients:
             return
-        await self._send_all(json.dumps({"type": event_type, "data": data}))
+        await self._send_all(_encode({"type": event_type, "data": data}))
 
     async def push_media(self, media_data: dict, reason: str = "update"):
         """Push a media update to all connected clients."""
         if not self._ws_clients:
             return
-        await self._send_all(json.dumps(
+        await self._send_all(_encode(
             {"type": "media_update", "data": media_data, "reason": reason}))
 
     async def push_idle(self, reason: str = "source_deactivated"):
@@ -219,24 +236,24 @@ class MediaState:
             # Replay current state to new client
             active = get_source_snapshot()
             if active:
-                await ws.send_str(json.dumps({
+                await ws.send_frame(_encode({
                     "type": "source_change",
                     "data": {
                         "active_source": active.id,
                         "source_name": active.name,
                         "player": active.player,
                     },
-                }))
-            await ws.send_str(json.dumps({
+                }), WSMsgType.TEXT)
+            await ws.send_frame(_encode({
                 "type": "volume_update",
                 "data": {"volume": round(get_volume())},
-            }))
+            }), WSMsgType.TEXT)
             if self._state:
-                await ws.send_str(json.dumps({
+                await ws.send_frame(_encode({
                     "type": "media_update",
                     "data": self._state,
                     "reason": "client_connect",
-                }))
+                }), WSMsgType.TEXT)
             # Push-only — keep alive until client disconnects
             async for _msg in ws:
                 pass
@@ -75,6 +75,7 @@ log = logging.getLogger(__name__)
 
 # Artwork defaults — subclasses can override via class attributes
 MAX_ARTWORK_SIZE = 500 * 1024  # 500 KB limit for JPEG output
+MAX_ARTWORK_DIM = 800          # px; the UI shows artwork at ≤ 595×595
 ARTWORK_CACHE_SIZE = 100       # number of artworks to cache
 
 # Shared thread pool for CPU-bound image processing
@@ -88,6 +89,9 @@ ROUTER_VOLUME_REPORT_URL = ROUTER_VOLUME_REPORT
 ROUTER_PLAYBACK_OVERRIDE_URL = ROUTER_PLAYBACK_OVERRIDE
 ROUTER_OUTPUT_ON_URL = ROUTER_OUTPUT_ON
 
+# Media updates are POSTed to the router on every track/state change
+_MEDIA_POST_TIMEOUT = aiohttp.ClientTimeout(total=5)
+
 
 class ArtworkCache:
     """Simple LRU cache for artwork data (URL -> base64 dict)."""
@@ -130,20 +134,25 @@ def _process_image(image_bytes: bytes) -> dict | None:
         return None
     try:
         image = Image.open(BytesIO(image_bytes))
+        # Streaming-service art is often 1500–3000 px.  Let libjpeg decode
+        # at a reduced scale, then downsample to what the screen can show —
+        # one cheap encode instead of a full-size one (and maybe a second).
+        image.draft("RGB", (MAX_ARTWORK_DIM, MAX_ARTWORK_DIM))
         if image.mode in ("RGBA", "LA", "P"):
             image = image.convert("RGB")
+        image.thumbnail((MAX_ARTWORK_DIM, MAX_ARTWORK_DIM), Image.LANCZOS)
 
         buf = BytesIO()
         image.save(buf, "JPEG", quality=85)
         if buf.tell() > MAX_ARTWORK_SIZE:
-            buf = BytesIO()
+            buf.seek(0)
+            buf.truncate()
             image.save(buf, "JPEG", quality=60)
 
-        buf.seek(0)
-        return {
-            "base64": base64.b64encode(buf.getvalue()).decode("utf-8"),
-            "size": image.size,
-        }
+        # Encode straight off the buffer — getvalue() would copy the JPEG.
+        with buf.getbuffer() as jpeg:
+            encoded = base64.b64encode(jpeg).decode("ascii")
+        return {"base64": encoded, "size": image.size}
     except Exception as e:
         log.warning("Error processing image: %s", e)
         return None
@@ -228,8 +237,9 @@ class PlayerBase:
     async def fetch_artwork(self, url: str, session: aiohttp.ClientSession | None = None):
         """Fetch artwork from *url*, return ``{'base64': ..., 'size': ...}`` or None.
 
-        Results are cached in ``self._artwork_cache``.  If *session* is None a
-        temporary one is created (and closed).
+        Results are cached in ``self._artwork_cache``.  If *session* is None
+        the player's own session is used, or a temporary one (closed again)
+        when that isn't available.
         """
         cached = self._artwork_cache.get(url)
         if cached is not None:
@@ -238,6 +248,8 @@ class PlayerBase:
 
         log.debug("Artwork cache miss, fetching: %s", url)
         close_session = False
+        if session is None and self._session_ready():
+            session = self._http_session
         if session is None:
             session = aiohttp.ClientSession()
             close_session = True
@@ -279,8 +291,7 @@ class PlayerBase:
             log.debug("Skipping media broadcast — session not available (shutdown?)")
             return
         try:
-            payload = dict(media_data)
-            payload["_reason"] = reason
+            payload = {**media_data, "_reason": reason}
             if self._latest_action_ts:
                 payload["_action_ts"] = self._latest_action_ts
             # Include the current track URI so the router's canvas
@@ -295,7 +306,7 @@ class PlayerBase:
                 log.debug("get_track_uri failed during broadcast: %s", e)
             async with self._http_session.post(
                 ROUTER_MEDIA_URL, json=payload,
-                timeout=aiohttp.ClientTimeout(total=5),
+                timeout=_MEDIA_POST_TIMEOUT,
             ) as resp:
                 if resp.status == 200:
                     log.info("Posted media update to router: %s", reason)
@@ -540,48 +551,36 @@ class PlayerBase:
             {"status": "ok" if ok else "error", "shuffle": enabled},
             headers=self._cors_headers())
 
-    async def _handle_pause(self, request: web.Request) -> web.Response:
+    async def _run_simple_command(self, request: web.Request, command,
+                                  *, track_action_ts: bool = True) -> web.Response:
+        """Shared body for argument-less transport commands.
+
+        ``command`` is the bound coroutine method to run (``self.pause`` etc.).
+        With ``track_action_ts`` the request body's action_ts is recorded first.
+        """
         self._stamp_command()
-        ok = await self.pause()
+        if track_action_ts:
+            try:
+                data = await request.json()
+            except Exception:
+                data = {}
+            self._update_action_ts(data)
+        ok = await command()
         return web.json_response(
             {"status": "ok" if ok else "error"},
             headers=self._cors_headers())
 
+    async def _handle_pause(self, request: web.Request) -> web.Response:
+        return await self._run_simple_command(request, self.pause, track_action_ts=False)
+
     async def _handle_resume(self, request: web.Request) -> web.Response:
-        self._stamp_command()
-        try:
-            data = await request.json()
-        except Exception:
-            data = {}
-        self._update_action_ts(data)
-        ok = await self.resume()
-        return web.json_response(
-            {"status": "ok" if ok else "error"},
-            headers=self._cors_headers())
+        return await self._run_simple_command(request, self.resume)
 
     async def _handle_next(self, request: web.Request) -> web.Response:
-        self._stamp_command()
-        try:
-            data = await request.json()
-        except Exception:
-            data = {}
-        self._update_action_ts(data)
-        ok = await self.next_track()
-        return web.json_response(
-            {"status": "ok" if ok else "error"},
-            headers=self._cors_headers())
+        return await self._run_simple_command(request, self.next_track)
 
     async def _handle_prev(self, request: web.Request) -> web.Response:
-        self._stamp_command()
-        try:
-            data = await request.json()
-        except Exception:
-            data = {}
-        self._update_action_ts(data)
-        ok = await self.prev_track()
-        return web.json_response(
-            {"status": "ok" if ok else "error"},
-            headers=self._cors_headers())
+        return await self._run_simple_command(request, self.prev_track)
 
     async def _handle_stop(self, request: web.Request) -> web.Response:
         self._stamp_command()
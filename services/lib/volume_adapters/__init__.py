@@ -87,47 +87,86 @@ def create_volume_adapter(session: aiohttp.ClientSession) -> VolumeAdapter:
       input       – C4 amp source input for power_on (c4amp only, default "01")
       mixer_port  – masterlink.py mixer HTTP port (default 8768, powerlink only)
     """
+    # One snapshot of the volume section; the per-type constructors read
+    # their extra keys from it instead of going back through cfg().
+    vol_cfg = cfg("volume", default={})
     vol_type = infer_volume_type()
     # Default host: use player IP for sonos/bluesound/heos, otherwise beolab5 controller
-    vol_host_default = "beolab5-controller.local"
-    if vol_type in ("sonos", "bluesound", "heos") and not cfg("volume", "host"):
-        vol_host_default = cfg("player", "ip", default="")
-    elif vol_type == "powerlink" and not cfg("volume", "host"):
-        vol_host_default = "localhost"
-    vol_host = cfg("volume", "host", default=vol_host_default)
-    vol_max = int(cfg("volume", "max", default=70))
-
-    if vol_type == "powerlink":
-        host = cfg("volume", "host", default="localhost")
-        port = int(cfg("volume", "mixer_port", default=8768))
-        vol_default = int(cfg("volume", "default", default=30))
-        logger.info("Volume adapter: PowerLink via masterlink.py @ %s:%d (max %d, default %d)",
-                     host, port, vol_max, vol_default)
-        return PowerLinkVolume(host, vol_max, vol_default, session, port)
-    elif vol_type == "c4amp":
-        zone = str(cfg("volume", "zone", default="01"))
-        input_id = str(cfg("volume", "input", default="01"))
-        logger.info("Volume adapter: C4 amp @ %s zone %s (max %d%%)",
-                     vol_host, zone, vol_max)
-        return C4AmpVolume(vol_host, vol_max, zone, input_id)
-    elif vol_type == "bluesound":
-        logger.info("Volume adapter: BlueSound @ %s (max %d%%)", vol_host, vol_max)
-        return BluesoundVolume(vol_host, vol_max, session)
-    elif vol_type == "heos":
-        logger.info("Volume adapter: HEOS @ %s (max %d%%)", vol_host, vol_max)
-        return HeosVolume(vol_host, vol_max)
-    elif vol_type == "sonos":
-        logger.info("Volume adapter: Sonos @ %s (max %d%%)", vol_host, vol_max)
-        return SonosVolume(vol_host, vol_max)
-    elif vol_type == "hdmi":
-        logger.info("Volume adapter: HDMI1 ALSA software volume (max %d%%)", vol_max)
-        return HdmiVolume(vol_max)
-    elif vol_type == "spdif":
-        logger.info("Volume adapter: S/PDIF ALSA software volume (max %d%%)", vol_max)
-        return SpdifVolume(vol_max)
-    elif vol_type == "rca":
-        logger.info("Volume adapter: RCA analog output (no volume control, max %d%%)", vol_max)
-        return RcaVolume(vol_max)
-    else:
-        logger.info("Volume adapter: BeoLab 5 @ %s (max %d%%)", vol_host, vol_max)
-        return BeoLab5Volume(vol_host, vol_max, session)
+    vol_host = vol_cfg.get("host")
+    if not vol_host:
+        if vol_type in ("sonos", "bluesound", "heos"):
+            vol_host = cfg("player", "ip", default="")
+        elif vol_type == "powerlink":
+            vol_host = "localhost"
+        else:
+            vol_host = "beolab5-controller.local"
+    vol_max = int(vol_cfg.get("max", 70))
+    factory = _ADAPTER_FACTORIES.get(vol_type, _make_beolab5)
+    return factory(session, vol_host, vol_max, vol_cfg)
+
+
+# -- Per-type constructors (dispatched by volume.type) --
+
+def _make_powerlink(session, vol_host, vol_max, vol_cfg):
+    port = int(vol_cfg.get("mixer_port", 8768))
+    vol_default = int(vol_cfg.get("default", 30))
+    logger.info("Volume adapter: PowerLink via masterlink.py @ %s:%d (max %d, default %d)",
+                 vol_host, port, vol_max, vol_default)
+    return PowerLinkVolume(vol_host, vol_max, vol_default, session, port)
+
+
+def _make_c4amp(session, vol_host, vol_max, vol_cfg):
+    zone = str(vol_cfg.get("zone", "01"))
+    input_id = str(vol_cfg.get("input", "01"))
+    logger.info("Volume adapter: C4 amp @ %s zone %s (max %d%%)",
+                 vol_host, zone, vol_max)
+    return C4AmpVolume(vol_host, vol_max, zone, input_id)
+
+
+def _make_bluesound(session, vol_host, vol_max, vol_cfg):
+    logger.info("Volume adapter: BlueSound @ %s (max %d%%)", vol_host, vol_max)
+    return BluesoundVolume(vol_host, vol_max, session)
+
+
+def _make_heos(session, vol_host, vol_max, vol_cfg):
+    logger.info("Volume adapter: HEOS @ %s (max %d%%)", vol_host, vol_max)
+    return HeosVolume(vol_host, vol_max)
+
+
+def _make_sonos(session, vol_host, vol_max, vol_cfg):
+    logger.info("Volume adapter: Sonos @ %s (max %d%%)", vol_host, vol_max)
+    return SonosVolume(vol_host, vol_max)
+
+
+def _make_hdmi(session, vol_host, vol_max, vol_cfg):
+    logger.info("Volume adapter: HDMI1 ALSA software volume (max %d%%)", vol_max)
+    return HdmiVolume(vol_max)
+
+
+def _make_spdif(session, vol_host, vol_max, vol_cfg):
+    logger.info("Volume adapter: S/PDIF ALSA software volume (max %d%%)", vol_max)
+    return SpdifVolume(vol_max)
+
+
+def _make_rca(session, vol_host, vol_max, vol_cfg):
+    logger.info("Volume adapter: RCA analog output (no volume control, max %d%%)", vol_max)
+    return RcaVolume(vol_max)
+
+
+def _make_beolab5(session, vol_host, vol_max, vol_cfg):
+    logger.info("Volume adapter: BeoLab 5 @ %s (max %d%%)", vol_host, vol_max)
+    return BeoLab5Volume(vol_host, vol_max, session)
+
+
+# Unknown types fall back to BeoLab 5 (the original BS5 setup)
+_ADAPTER_FACTORIES = {
+    "powerlink": _make_powerlink,
+    "c4amp": _make_c4amp,
+    "bluesound": _make_bluesound,
+    "heos": _make_heos,
+    "sonos": _make_sonos,
+    "hdmi": _make_hdmi,
+    "spdif": _make_spdif,
+    "rca": _make_rca,
+    "beolab5": _make_beolab5,
+}
@@ -16,11 +16,28 @@ support them (power always on, balance always centred).
 """
 
 import asyncio
+import json
 import logging
 from abc import ABC, abstractmethod
 
+import aiohttp
+
+# Adapters parse small JSON replies on every UI tick; use orjson when the
+# system has it and fall back to the stdlib decoder otherwise.
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
 log = logging.getLogger("beo-router.volume")
 
+# What an HTTP adapter should expect from a flaky speaker: transport
+# failures, plus garbled bodies when a reply is parsed.  Anything else is
+# a bug and should reach the flush logger with its traceback.
+HTTP_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError)
+HTTP_READ_ERRORS = HTTP_ERRORS + (ValueError, TypeError)
+
 
 class VolumeAdapter(ABC):
     """Interface every volume output must implement."""
@@ -29,13 +46,9 @@ class VolumeAdapter(ABC):
         self._max_volume = max_volume
         self._pending_volume: float | None = None
         self._debounce_handle: asyncio.TimerHandle | None = None
+        self._debounce_deadline: float = 0.0  # loop time the debounce expires
         self._flush_task: asyncio.Task | None = None
         self._debounce_ms = debounce_ms
-        # Serializes flushes: adapters allow multi-second HTTP timeouts, so
-        # without this two in-flight _apply_volume calls (rapid wheel turns
-        # + a laggy speaker) can complete in reverse order, leaving the
-        # hardware at the OLDER volume while the UI shows the newer one.
-        self._flush_lock = asyncio.Lock()
 
     # -- Volume (debounced) --
 
@@ -45,14 +58,38 @@ class VolumeAdapter(ABC):
         if volume > self._max_volume:
             log.warning("Volume %.0f%% capped to %d%%", volume, self._max_volume)
         self._pending_volume = capped
-        if self._debounce_handle is not None:
-            self._debounce_handle.cancel()
+        # Push the deadline out instead of cancelling and re-arming a timer
+        # on every wheel tick; _on_debounce re-arms itself if it fires early.
+        loop = asyncio.get_running_loop()
+        self._debounce_deadline = loop.time() + self._debounce_ms / 1000
+        if self._debounce_handle is None:
+            self._debounce_handle = loop.call_at(
+                self._debounce_deadline, self._on_debounce)
+
+    def _on_debounce(self):
+        """Debounce timer fired: re-arm if the deadline moved, else flush."""
         loop = asyncio.get_running_loop()
-        self._debounce_handle = loop.call_later(
-            self._debounce_ms / 1000,
-            lambda: setattr(self, '_flush_task',
-                            loop.create_task(self._do_flush_with_logging())),
-        )
+        if loop.time() < self._debounce_deadline:
+            self._debounce_handle = loop.call_at(
+                self._debounce_deadline, self._on_debounce)
+            return
+        self._debounce_handle = None
+        self._start_flush()
+
+    def _start_flush(self):
+        """Start a flush unless one is already in flight.
+
+        At most one flush runs at a time.  Adapters allow multi-second HTTP
+        timeouts, so two concurrent _apply_volume calls (rapid wheel turns +
+        a laggy speaker) could complete in reverse order, leaving the
+        hardware at the OLDER volume while the UI shows the newer one.  A
+        running flush re-reads _pending_volume after each send instead, so
+        a burst of N changes costs at most two hardware writes.
+        """
+        if self._flush_task is not None and not self._flush_task.done():
+            return
+        self._flush_task = asyncio.get_running_loop().create_task(
+            self._do_flush_with_logging())
 
     async def _do_flush_with_logging(self):
         """Wrap _do_flush so debounce callback exceptions don't vanish."""
@@ -62,16 +99,10 @@ class VolumeAdapter(ABC):
             log.exception("Volume adapter flush failed: %s", e)
 
     async def _do_flush(self):
-        """Send the pending volume to hardware (serialized, latest wins)."""
-        async with self._flush_lock:
-            # Re-read under the lock: while we waited for an in-flight
-            # apply, a newer set_volume may have queued a fresher value —
-            # sending that one collapses the queue to latest-wins.
+        """Send pending volumes to hardware until none is left (latest wins)."""
+        while self._pending_volume is not None:
             vol = self._pending_volume
-            if vol is None:
-                return
             self._pending_volume = None
-            self._debounce_handle = None
             await self._apply_volume(vol)
 
     @abstractmethod
@@ -90,6 +121,13 @@ class VolumeAdapter(ABC):
         Returns None if no cached value is available."""
         return None
 
+    def observe_volume(self, volume: float) -> None:
+        """Note a hardware volume reported by the player service.
+
+        Adapters that cache the device's level can refresh it from here
+        instead of reading it back themselves.
+        """
+
     # -- Optional: override in adapters that support power control --
 
     async def power_on(self) -> None:
@@ -115,3 +153,8 @@ class VolumeAdapter(ABC):
 
     async def set_tone(self, **kwargs) -> dict | None:
         return None
+
+    # -- Optional: override in adapters that hold connections or tasks --
+
+    async def close(self) -> None:
+        pass  # nothing to release by default
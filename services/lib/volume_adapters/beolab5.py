@@ -6,11 +6,20 @@ import asyncio
 import logging
 
 import aiohttp
+from yarl import URL
 
-from .base import VolumeAdapter
+from .base import HTTP_ERRORS, HTTP_READ_ERRORS, VolumeAdapter, json_loads
 
 logger = logging.getLogger("beo-router.volume.beolab5")
 
+_TIMEOUT_FAST = aiohttp.ClientTimeout(total=1.0)
+_TIMEOUT_NORMAL = aiohttp.ClientTimeout(total=2.0)
+# The event stream is long-lived; ESPHome pings every few seconds, so a
+# silent socket means the controller has gone away.
+_TIMEOUT_EVENTS = aiohttp.ClientTimeout(total=None, sock_connect=5.0, sock_read=60.0)
+_EVENTS_RETRY_MIN = 5.0
+_EVENTS_RETRY_MAX = 60.0
+
 
 class BeoLab5Volume(VolumeAdapter):
     """Volume control via the BeoLab 5 controller REST API."""
@@ -20,12 +29,26 @@ class BeoLab5Volume(VolumeAdapter):
         self._host = host
         self._session = session
         self._base = f"http://{host}"
+        # Parsed once: every wheel tick and power poll reuses these URLs
+        self._url_volume = URL(f"{self._base}/number/volume")
+        self._url_volume_set = URL(f"{self._base}/number/volume/set")
+        self._url_balance = URL(f"{self._base}/number/balance")
+        self._url_balance_set = URL(f"{self._base}/number/balance/set")
+        self._url_power = URL(f"{self._base}/switch/power")
+        self._url_power_on = URL(f"{self._base}/switch/power/turn_on")
+        self._url_power_off = URL(f"{self._base}/switch/power/turn_off")
+        self._url_events = URL(f"{self._base}/events")
         # Cached power state to avoid HTTP round-trip on every volume change
         self._power_cache: bool | None = None
         self._power_cache_time: float = 0
         self._power_cache_ttl = 30.0  # seconds
         self._last_volume: float = 0  # last volume sent, for safe power-on
         self._power_on_max = 40  # cap volume on power-on (%)
+        # ESPHome /events subscription: while it is live, power and volume
+        # are pushed to us and is_on()/get_volume() never hit the network.
+        self._events_task: asyncio.Task | None = None
+        self._events_live = False
+        self._event_volume: float | None = None
 
     # -- public API --
 
@@ -36,27 +59,33 @@ class BeoLab5Volume(VolumeAdapter):
     async def _apply_volume(self, volume: float) -> None:
         try:
             async with self._session.post(
-                f"{self._base}/number/volume/set",
-                params={"value": str(volume)},
-                timeout=aiohttp.ClientTimeout(total=2.0),
+                self._url_volume_set,
+                params={"value": f"{volume:.0f}"},
+                timeout=_TIMEOUT_NORMAL,
             ) as resp:
                 self._last_volume = volume
+                # Until the controller pushes it back, this is the level a
+                # live event stream should report — not the previous one.
+                self._event_volume = volume
                 logger.info("-> BeoLab 5 volume: %.0f%% (HTTP %d)", volume, resp.status)
-        except Exception as e:
+        except HTTP_ERRORS as e:
             logger.warning("BeoLab 5 controller unreachable: %s", e)
 
     async def get_volume(self) -> float | None:
+        self._ensure_events()
+        if self._events_live and self._event_volume is not None:
+            return self._event_volume
         try:
             async with self._session.get(
-                f"{self._base}/number/volume",
-                timeout=aiohttp.ClientTimeout(total=2.0),
+                self._url_volume,
+                timeout=_TIMEOUT_NORMAL,
             ) as resp:
-                data = await resp.json()
+                data = await resp.json(loads=json_loads)
                 vol = float(data.get("value", 0))
                 self._last_volume = vol
                 logger.info("BeoLab 5 volume read: %.0f%%", vol)
                 return vol
-        except Exception as e:
+        except HTTP_READ_ERRORS as e:
             logger.warning("Could not read BeoLab 5 volume: %s", e)
             return None
 
@@ -64,23 +93,23 @@ class BeoLab5Volume(VolumeAdapter):
         bal = max(-20, min(20, balance))
         try:
             async with self._session.post(
-                f"{self._base}/number/balance/set",
+                self._url_balance_set,
                 params={"value": str(bal)},
-                timeout=aiohttp.ClientTimeout(total=2.0),
+                timeout=_TIMEOUT_NORMAL,
             ) as resp:
                 logger.info("-> BeoLab 5 balance: %.0f (HTTP %d)", bal, resp.status)
-        except Exception as e:
+        except HTTP_ERRORS as e:
             logger.warning("BeoLab 5 controller unreachable (balance): %s", e)
 
     async def get_balance(self) -> float:
         try:
             async with self._session.get(
-                f"{self._base}/number/balance",
-                timeout=aiohttp.ClientTimeout(total=2.0),
+                self._url_balance,
+                timeout=_TIMEOUT_NORMAL,
             ) as resp:
-                data = await resp.json()
+                data = await resp.json(loads=json_loads)
                 return float(data.get("value", 0))
-        except Exception as e:
+        except HTTP_READ_ERRORS as e:
             logger.warning("Could not read BeoLab 5 balance: %s", e)
             return 0
 
@@ -107,23 +136,26 @@ class BeoLab5Volume(VolumeAdapter):
     async def power_on(self) -> None:
         try:
             async with self._session.post(
-                f"{self._base}/switch/power/turn_on",
-                timeout=aiohttp.ClientTimeout(total=2.0),
+                self._url_power_on,
+                timeout=_TIMEOUT_NORMAL,
             ) as resp:
                 logger.info("BeoLab 5 power on: HTTP %d", resp.status)
                 self._power_cache = True
                 self._power_cache_time = asyncio.get_running_loop().time()
-        except Exception as e:
+        except HTTP_ERRORS as e:
             logger.warning("Could not power on BeoLab 5: %s", e)
             return
-        # Always send a safe volume on power-on
+        # Always send a safe volume on power-on.  Written directly: power-on
+        # is a one-off, so there is nothing for the debounce to coalesce.
         safe_vol = self._last_volume
         if safe_vol < 1 or safe_vol > self._power_on_max:
             safe_vol = self._power_on_max
+        safe_vol = min(safe_vol, self._max_volume)
         logger.info("Power-on volume: %.0f%% (last=%.0f%%, cap=%d%%)",
                      safe_vol, self._last_volume, self._power_on_max)
-        await self.set_volume(safe_vol)
-        # Read back actual volume to sync state
+        await self._apply_volume(safe_vol)
+        # Read back actual volume to sync state (after the write, or it
+        # would race it and return the pre-power-on level)
         readback = await self.get_volume()
         if readback is not None:
             self._last_volume = readback
@@ -131,31 +163,111 @@ class BeoLab5Volume(VolumeAdapter):
     async def power_off(self) -> None:
         try:
             async with self._session.post(
-                f"{self._base}/switch/power/turn_off",
-                timeout=aiohttp.ClientTimeout(total=2.0),
+                self._url_power_off,
+                timeout=_TIMEOUT_NORMAL,
             ) as resp:
                 logger.info("BeoLab 5 power off: HTTP %d", resp.status)
                 self._power_cache = False
                 self._power_cache_time = asyncio.get_running_loop().time()
-        except Exception as e:
+        except HTTP_ERRORS as e:
             logger.warning("Could not power off BeoLab 5: %s", e)
 
     def is_on_cached(self) -> bool | None:
         return self._power_cache
 
     async def is_on(self) -> bool:
+        self._ensure_events()
         now = asyncio.get_running_loop().time()
-        if self._power_cache is not None and (now - self._power_cache_time) < self._power_cache_ttl:
+        if self._power_cache is not None and (
+                self._events_live or (now - self._power_cache_time) < self._power_cache_ttl):
             return self._power_cache
         try:
             async with self._session.get(
-                f"{self._base}/switch/power",
-                timeout=aiohttp.ClientTimeout(total=1.0),
+                self._url_power,
+                timeout=_TIMEOUT_FAST,
             ) as resp:
-                data = await resp.json()
+                data = await resp.json(loads=json_loads)
                 self._power_cache = data.get("value", False) is True
                 self._power_cache_time = now
                 return self._power_cache
-        except Exception as e:
+        except HTTP_READ_ERRORS as e:
             logger.warning("Could not check BeoLab 5 power state: %s", e)
             return self._power_cache if self._power_cache is not None else False
+
+    async def close(self) -> None:
+        if self._events_task is not None:
+            self._events_task.cancel()
+            try:
+                await self._events_task
+            except asyncio.CancelledError:
+                pass
+            self._events_task = None
+        self._events_live = False
+
+    # -- ESPHome event stream --
+
+    def _ensure_events(self) -> None:
+        """Start the /events subscription on first use (needs a running loop)."""
+        if self._events_task is None:
+            self._events_task = asyncio.get_running_loop().create_task(
+                self._watch_events())
+
+    async def _watch_events(self) -> None:
+        """Follow the controller's SSE stream, reconnecting with backoff.
+
+        A 404 means the firmware has no web_server event source; give up
+        and leave is_on()/get_volume() on the polling path for good.
+        """
+        backoff = _EVENTS_RETRY_MIN
+        while True:
+            try:
+                async with self._session.get(
+                    self._url_events,
+                    timeout=_TIMEOUT_EVENTS,
+                ) as resp:
+                    if resp.status == 404:
+                        logger.info("BeoLab 5 controller has no /events stream, polling instead")
+                        return
+                    resp.raise_for_status()
+                    self._events_live = True
+                    backoff = _EVENTS_RETRY_MIN
+                    logger.info("Subscribed to BeoLab 5 event stream")
+                    event = ""
+                    async for raw in resp.content:
+                        line = raw.decode("utf-8", "replace").rstrip("\r\n")
+                        if line.startswith("event:"):
+                            event = line[6:].strip()
+                        elif line.startswith("data:") and event == "state":
+                            self._on_state_event(line[5:].strip())
+                        elif not line:
+                            event = ""
+            except HTTP_ERRORS as e:
+                logger.warning("BeoLab 5 event stream lost: %s", e)
+            except Exception:
+                # e.g. an over-long line from resp.content — reconnect rather
+                # than let the task die and strand us on stale pushed state
+                logger.exception("BeoLab 5 event stream failed")
+            finally:
+                self._events_live = False
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, _EVENTS_RETRY_MAX)
+
+    def _on_state_event(self, payload: str) -> None:
+        try:
+            data = json_loads(payload)
+        except ValueError:
+            return
+        if not isinstance(data, dict):
+            return
+        # Older ESPHome sends "switch-power", web_server v3 "switch/power"
+        entity = str(data.get("id", "")).replace("/", "-")
+        if entity == "switch-power":
+            self._power_cache = data.get("value") is True
+            self._power_cache_time = asyncio.get_running_loop().time()
+        elif entity == "number-volume":
+            try:
+                vol = float(data.get("value"))
+            except (TypeError, ValueError):
+                return
+            self._event_volume = vol
+            self._last_volume = vol
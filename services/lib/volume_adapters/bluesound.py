@@ -4,16 +4,23 @@ BlueSound volume adapter — controls volume via BluOS HTTP API.
 
 import asyncio
 import logging
+import re
 from xml.etree import ElementTree
 
 import aiohttp
+from yarl import URL
 
-from .base import VolumeAdapter
+from .base import HTTP_ERRORS, HTTP_READ_ERRORS, VolumeAdapter
 
 logger = logging.getLogger("beo-router.volume.bluesound")
 
 BLUOS_PORT = 11000
 
+_TIMEOUT = aiohttp.ClientTimeout(total=5)
+
+# /Volume answers with a single element, e.g. <volume db="-20" ...>32</volume>
+_VOLUME_RE = re.compile(rb"<volume[^>]*>\s*(\d+)\s*</volume>")
+
 
 class BluesoundVolume(VolumeAdapter):
     """Volume control via BluOS HTTP API (port 11000)."""
@@ -23,34 +30,42 @@ class BluesoundVolume(VolumeAdapter):
         self._ip = ip
         self._session = session
         self._base_url = f"http://{ip}:{BLUOS_PORT}"
+        self._url_volume = URL(f"{self._base_url}/Volume")
 
     async def _apply_volume(self, volume: float) -> None:
         try:
             async with self._session.get(
-                f"{self._base_url}/Volume?level={int(volume)}",
-                timeout=aiohttp.ClientTimeout(total=5),
+                self._url_volume.with_query(level=int(volume)),
+                timeout=_TIMEOUT,
             ) as resp:
                 resp.raise_for_status()
                 logger.info("-> BlueSound volume: %.0f%%", volume)
-        except Exception as e:
+        except HTTP_ERRORS as e:
             logger.warning("BlueSound unreachable: %s", e)
 
     async def get_volume(self) -> float | None:
         try:
             async with self._session.get(
-                f"{self._base_url}/Volume",
-                timeout=aiohttp.ClientTimeout(total=5),
+                self._url_volume,
+                timeout=_TIMEOUT,
             ) as resp:
                 resp.raise_for_status()
-                text = await resp.text()
-                root = ElementTree.fromstring(text)
-                vol_text = root.text if root.text else root.get("volume", "0")
-                vol = int(vol_text)
+                body = await resp.read()
+                m = _VOLUME_RE.search(body)
+                if m:
+                    vol = int(m.group(1))
+                else:
+                    root = ElementTree.fromstring(body)
+                    vol_text = root.text if root.text else root.get("volume", "0")
+                    vol = int(vol_text)
                 logger.info("BlueSound volume read: %d%%", vol)
                 return float(vol)
-        except Exception as e:
+        except (*HTTP_READ_ERRORS, ElementTree.ParseError) as e:
             logger.warning("Could not read BlueSound volume: %s", e)
             return None
 
+    def is_on_cached(self) -> bool | None:
+        return True
+
     async def is_on(self) -> bool:
         return True  # BlueSound is always on
@@ -76,6 +76,9 @@ class C4AmpVolume(VolumeAdapter):
         self._is_on = False
         logger.info("C4 amp zone %s off", self._zone)
 
+    def is_on_cached(self) -> bool | None:
+        return self._is_on
+
     async def is_on(self) -> bool:
         return self._is_on
 
@@ -17,6 +17,10 @@ import os
 
 from .local import LocalVolume
 
+# Read at import: the systemd unit fixes the environment for the process
+_DEFAULT_CARD = os.getenv("ALSA_CARD", "vc4hdmi1")
+_DEFAULT_CONTROL = os.getenv("ALSA_CONTROL", "Playback")
+
 
 class HdmiVolume(LocalVolume):
     """Volume control via ALSA software mixer on HDMI1."""
@@ -25,7 +29,7 @@ class HdmiVolume(LocalVolume):
                  control: str | None = None):
         super().__init__(
             max_volume,
-            card=card or os.getenv("ALSA_CARD", "vc4hdmi1"),
-            control=control or os.getenv("ALSA_CONTROL", "Playback"),
+            card=card or _DEFAULT_CARD,
+            control=control or _DEFAULT_CONTROL,
             label="HDMI1",
         )
@@ -126,5 +126,8 @@ class HeosVolume(VolumeAdapter):
             logger.warning("Could not parse HEOS volume response: %s", e)
             return None
 
+    def is_on_cached(self) -> bool | None:
+        return True
+
     async def is_on(self) -> bool:
         return True  # HEOS is network standby — always reachable
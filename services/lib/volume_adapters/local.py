@@ -1,18 +1,31 @@
 """
 Local ALSA volume adapter — shared base for HDMI, S/PDIF, and RCA outputs.
 
-All three use ALSA software volume via amixer.  Subclasses only need to
-specify the card name, control name, and display label.
+All three use ALSA software volume.  Subclasses only need to specify the
+card name, control name, and display label.
+
+When pyalsaaudio is installed (``python3-alsaaudio``) the mixer is opened
+once and driven in-process; otherwise every change forks ``amixer``.
 """
 
 import asyncio
 import logging
 import os
+import re
 
 from .base import VolumeAdapter
 
+try:
+    import alsaaudio
+    _HAS_ALSAAUDIO = True
+except ImportError:
+    _HAS_ALSAAUDIO = False
+
 logger = logging.getLogger("beo-router.volume.local")
 
+# First "[NN%]" in `amixer sget` output, e.g. "Mono: Playback 52 [55%] [on]"
+_AMIXER_PCT_RE = re.compile(r"\[(\d+)%\]")
+
 
 class LocalVolume(VolumeAdapter):
     """Volume control via ALSA software mixer.  Subclass and set card/control."""
@@ -23,13 +36,52 @@ class LocalVolume(VolumeAdapter):
         self._control = control
         self._label = label
         self._powered = False
+        self._mixer = None  # alsaaudio.Mixer, opened lazily
+        self._amixer_argv = ("amixer", "-c", card)  # fallback command prefix
+
+    def _get_mixer(self):
+        """Return the in-process ALSA mixer, or None to fall back to amixer.
+
+        Opening is retried on each call until it succeeds, so a card that
+        shows up after the router starts is picked up.
+        """
+        if self._mixer is None and _HAS_ALSAAUDIO:
+            try:
+                self._mixer = alsaaudio.Mixer(
+                    control=self._control,
+                    cardindex=alsaaudio.cards().index(self._card))
+            except (ValueError, alsaaudio.ALSAAudioError) as e:
+                logger.debug("ALSA mixer %s/%s unavailable, using amixer: %s",
+                             self._card, self._control, e)
+        return self._mixer
+
+    def _mixer_call(self, method: str, *args):
+        """Run one mixer operation.  Returns (ok, result).
+
+        Mixer ops are a single ioctl on the control device, so they run
+        inline rather than paying for an executor hop.
+        """
+        mixer = self._get_mixer()
+        if mixer is None:
+            return False, None
+        try:
+            return True, getattr(mixer, method)(*args)
+        except alsaaudio.ALSAAudioError as e:
+            logger.warning("ALSA mixer %s failed on %s/%s: %s",
+                           method, self._card, self._control, e)
+            self._mixer = None  # reopen (or fall back) next time
+            return False, None
 
     async def _amixer(self, *args) -> str:
-        """Run an amixer command and return stdout."""
-        cmd = ["amixer", "-c", self._card] + list(args)
+        """Run an amixer command and return stdout.
+
+        Writes pass ``-q``: their output is never read, so amixer need not
+        print the control's state back.  Volumes stay on amixer's linear
+        scale (no ``-M``) to match what the in-process mixer sets.
+        """
         try:
             proc = await asyncio.create_subprocess_exec(
-                *cmd,
+                *self._amixer_argv, *args,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
             )
@@ -43,27 +95,37 @@ class LocalVolume(VolumeAdapter):
             return ""
 
     async def _apply_volume(self, volume: float) -> None:
-        await self._amixer("sset", self._control, f"{volume:.0f}%")
+        ok, _ = self._mixer_call("setvolume", int(round(volume)))
+        if not ok:
+            await self._amixer("-q", "sset", self._control, f"{volume:.0f}%")
         logger.info("-> %s volume: %.0f%%", self._label, volume)
 
     async def get_volume(self) -> float:
+        ok, _ = self._mixer_call("handleevents")  # refresh external changes
+        if ok:
+            ok, levels = self._mixer_call("getvolume")
+            if ok and levels:
+                return float(levels[0])
         output = await self._amixer("sget", self._control)
-        for line in output.splitlines():
-            if "%" in line:
-                start = line.index("[") + 1
-                end = line.index("%")
-                return float(line[start:end])
-        return 0
+        m = _AMIXER_PCT_RE.search(output)
+        return float(m.group(1)) if m else 0
 
     async def power_on(self) -> None:
-        await self._amixer("sset", self._control, "unmute")
+        ok, _ = self._mixer_call("setmute", 0)
+        if not ok:
+            await self._amixer("-q", "sset", self._control, "unmute")
         self._powered = True
         logger.info("%s audio unmuted", self._label)
 
     async def power_off(self) -> None:
-        await self._amixer("sset", self._control, "mute")
+        ok, _ = self._mixer_call("setmute", 1)
+        if not ok:
+            await self._amixer("-q", "sset", self._control, "mute")
         self._powered = False
         logger.info("%s audio muted", self._label)
 
+    def is_on_cached(self) -> bool | None:
+        return self._powered
+
     async def is_on(self) -> bool:
         return self._powered
@@ -15,14 +15,20 @@ endpoint, which applies it via ALSA (amixer) and also pokes the PC2 via 0xE3
 as a best-effort (PC2 firmware may ignore 0xE3 after power-on).
 """
 
+import asyncio
 import logging
 
 import aiohttp
+from yarl import URL
 
-from .base import VolumeAdapter
+from .base import HTTP_ERRORS, HTTP_READ_ERRORS, VolumeAdapter, json_loads
 
 logger = logging.getLogger("beo-router.volume.powerlink")
 
+_TIMEOUT_FAST = aiohttp.ClientTimeout(total=1.0)
+_TIMEOUT_NORMAL = aiohttp.ClientTimeout(total=2.0)
+_TIMEOUT_POWER = aiohttp.ClientTimeout(total=3.0)
+
 
 class PowerLinkVolume(VolumeAdapter):
     """Volume control via masterlink.py mixer HTTP API."""
@@ -35,34 +41,42 @@ class PowerLinkVolume(VolumeAdapter):
         self._default_volume = default_volume
         self._session = session
         self._base = f"http://{host}:{port}"
+        # Parsed once: every volume step and status poll reuses these URLs
+        self._url_volume = URL(f"{self._base}/mixer/volume")
+        self._url_status = URL(f"{self._base}/mixer/status")
+        self._url_power = URL(f"{self._base}/mixer/power")
+        self._url_tone = URL(f"{self._base}/mixer/tone")
         self._cached_on: bool = False
+        # Cached power state to avoid an HTTP round-trip on every is_on()
+        self._power_cache_time: float = 0
+        self._power_cache_ttl = 30.0  # seconds
 
     async def _apply_volume(self, volume: float) -> None:
-        volume = min(int(volume), self._max_volume)
+        volume = int(volume)  # already capped by set_volume()
         try:
             async with self._session.post(
-                f"{self._base}/mixer/volume",
+                self._url_volume,
                 json={"volume": volume},
-                timeout=aiohttp.ClientTimeout(total=2.0),
+                timeout=_TIMEOUT_NORMAL,
             ) as resp:
-                data = await resp.json()
+                data = await resp.json(loads=json_loads)
                 confirmed = data.get("volume_confirmed", volume)
                 logger.info("-> PowerLink volume: %d (confirmed %d, HTTP %d)",
                             volume, confirmed, resp.status)
-        except Exception as e:
+        except HTTP_READ_ERRORS as e:
             logger.warning("PowerLink mixer unreachable: %s", e)
 
     async def get_volume(self) -> float:
         try:
             async with self._session.get(
-                f"{self._base}/mixer/status",
-                timeout=aiohttp.ClientTimeout(total=2.0),
+                self._url_status,
+                timeout=_TIMEOUT_NORMAL,
             ) as resp:
-                data = await resp.json()
+                data = await resp.json(loads=json_loads)
                 vol = float(data.get("volume_confirmed", data.get("volume", 0)))
                 logger.info("PowerLink volume read: %d", vol)
                 return vol
-        except Exception as e:
+        except HTTP_READ_ERRORS as e:
             logger.warning("Could not read PowerLink volume: %s", e)
             return None
 
@@ -72,39 +86,45 @@ class PowerLinkVolume(VolumeAdapter):
     async def power_on(self) -> None:
         try:
             async with self._session.post(
-                f"{self._base}/mixer/power",
+                self._url_power,
                 json={"on": True, "volume": self._default_volume},
-                timeout=aiohttp.ClientTimeout(total=3.0),
+                timeout=_TIMEOUT_POWER,
             ) as resp:
                 self._cached_on = True
+                self._power_cache_time = asyncio.get_running_loop().time()
                 logger.info("PowerLink power on (vol %d): HTTP %d",
                             self._default_volume, resp.status)
-        except Exception as e:
+        except HTTP_ERRORS as e:
             logger.warning("Could not power on PowerLink: %s", e)
 
     async def power_off(self) -> None:
         try:
             async with self._session.post(
-                f"{self._base}/mixer/power",
+                self._url_power,
                 json={"on": False},
-                timeout=aiohttp.ClientTimeout(total=2.0),
+                timeout=_TIMEOUT_NORMAL,
             ) as resp:
                 self._cached_on = False
+                self._power_cache_time = asyncio.get_running_loop().time()
                 logger.info("PowerLink power off: HTTP %d", resp.status)
-        except Exception as e:
+        except HTTP_ERRORS as e:
             logger.warning("Could not power off PowerLink: %s", e)
 
     async def is_on(self) -> bool:
+        now = asyncio.get_running_loop().time()
+        if self._power_cache_time and (now - self._power_cache_time) < self._power_cache_ttl:
+            return self._cached_on
         try:
             async with self._session.get(
-                f"{self._base}/mixer/status",
-                timeout=aiohttp.ClientTimeout(total=1.0),
+                self._url_status,
+                timeout=_TIMEOUT_FAST,
             ) as resp:
-                data = await resp.json()
+                data = await resp.json(loads=json_loads)
                 on = data.get("speakers_on", False) is True
                 self._cached_on = on
+                self._power_cache_time = now
                 return on
-        except Exception as e:
+        except HTTP_READ_ERRORS as e:
             logger.warning("Could not check PowerLink state: %s", e)
             return False
 
@@ -113,11 +133,11 @@ class PowerLinkVolume(VolumeAdapter):
     async def get_tone(self) -> dict | None:
         try:
             async with self._session.get(
-                f"{self._base}/mixer/tone",
-                timeout=aiohttp.ClientTimeout(total=2.0),
+                self._url_tone,
+                timeout=_TIMEOUT_NORMAL,
             ) as resp:
-                return await resp.json()
-        except Exception as e:
+                return await resp.json(loads=json_loads)
+        except HTTP_READ_ERRORS as e:
             logger.warning("Could not read PowerLink tone: %s", e)
             return None
 
@@ -130,13 +150,13 @@ class PowerLinkVolume(VolumeAdapter):
             return None
         try:
             async with self._session.post(
-                f"{self._base}/mixer/tone",
+                self._url_tone,
                 json=body,
-                timeout=aiohttp.ClientTimeout(total=3.0),
+                timeout=_TIMEOUT_POWER,
             ) as resp:
-                data = await resp.json()
+                data = await resp.json(loads=json_loads)
                 logger.info("-> PowerLink tone: %s (HTTP %d)", body, resp.status)
                 return data
-        except Exception as e:
+        except HTTP_READ_ERRORS as e:
             logger.warning("PowerLink tone set failed: %s", e)
             return None
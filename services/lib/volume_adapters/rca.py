@@ -19,6 +19,9 @@ import os
 
 from .local import LocalVolume
 
+_DEFAULT_CARD = os.getenv("ALSA_CARD", "sndrpihifiberry")
+_DEFAULT_CONTROL = os.getenv("ALSA_CONTROL", "Digital")
+
 
 class RcaVolume(LocalVolume):
     """Volume control via ALSA software mixer on DAC HAT."""
@@ -27,7 +30,7 @@ class RcaVolume(LocalVolume):
                  control: str | None = None):
         super().__init__(
             max_volume,
-            card=card or os.getenv("ALSA_CARD", "sndrpihifiberry"),
-            control=control or os.getenv("ALSA_CONTROL", "Digital"),
+            card=card or _DEFAULT_CARD,
+            control=control or _DEFAULT_CONTROL,
             label="RCA",
         )
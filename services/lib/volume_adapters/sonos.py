@@ -4,37 +4,74 @@ Sonos volume adapter — controls volume via SoCo library.
 
 import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from operator import methodcaller
 
 from .base import VolumeAdapter
 
 logger = logging.getLogger("beo-router.volume.sonos")
 
+# A repeat of the last written level inside this window is dropped.  The
+# window is short because the Sonos app can move the volume behind our back.
+_DEDUP_WINDOW = 5.0  # seconds
+
+# Upper bound on how long a caller waits for one SoCo call
+_CALL_TIMEOUT = 2.0  # seconds
+
+_PAUSE = methodcaller("pause")
+
+# After this many consecutive failed SoCo calls the speaker is treated as
+# gone for _BREAKER_COOLDOWN seconds and calls return without trying.
+_BREAKER_THRESHOLD = 3
+_BREAKER_COOLDOWN = 5.0  # seconds
+
 
 class SonosVolume(VolumeAdapter):
     """Volume control via SoCo library talking directly to a Sonos speaker."""
 
     def __init__(self, ip: str, max_volume: int):
-        super().__init__(max_volume, debounce_ms=50)
-        from soco import SoCo
+        # SOAP round-trips run 30–80 ms on wired LAN and more on mesh Wi-Fi;
+        # a shorter window just lines writes up behind each other.
+        super().__init__(max_volume, debounce_ms=150)
         self._ip = ip
-        self._speaker = SoCo(ip)
+        self._speaker = None  # soco.SoCo, built on the worker by _get_speaker()
+        # One worker per speaker: SOAP calls reach the speaker in the order
+        # they were issued and never queue behind unrelated blocking work
+        # in the loop's default executor.
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=f"sonos-{ip}")
+        self._last_applied: int | None = None
+        self._last_applied_at: float = 0.0
+        self._fail_count = 0
+        self._open_until: float = 0.0  # loop time the breaker closes again
 
     async def _apply_volume(self, volume: float) -> None:
         # Control ONLY the paired speaker's own volume, even when it is grouped
         # with others. If the speaker is part of a group you're listening to,
         # this changes just this speaker's contribution — that's intentional.
+        target = int(volume)
+        loop = asyncio.get_running_loop()
+        if (target == self._last_applied
+                and loop.time() - self._last_applied_at < _DEDUP_WINDOW):
+            return
+        if loop.time() < self._open_until:
+            return
         try:
-            loop = asyncio.get_running_loop()
-            await loop.run_in_executor(
-                None, lambda: setattr(self._speaker, 'volume', int(volume)))
+            await self._call(setattr, 'volume', target)
+            self._last_applied = target
+            self._last_applied_at = loop.time()
             logger.info("-> Sonos volume: %.0f%%", volume)
         except Exception as e:
             logger.warning("Sonos unreachable: %s", e)
 
     async def get_volume(self) -> float | None:
+        loop = asyncio.get_running_loop()
+        if loop.time() < self._open_until:
+            return None
         try:
-            loop = asyncio.get_running_loop()
-            vol = await loop.run_in_executor(None, lambda: self._speaker.volume)
+            vol = await self._call(getattr, 'volume')
+            self._last_applied = vol
+            self._last_applied_at = loop.time()
             logger.info("Sonos volume read: %d%%", vol)
             return float(vol)
         except Exception as e:
@@ -42,12 +79,63 @@ class SonosVolume(VolumeAdapter):
             return None
 
     async def power_off(self) -> None:
+        if asyncio.get_running_loop().time() < self._open_until:
+            return
         try:
-            loop = asyncio.get_running_loop()
-            await loop.run_in_executor(None, self._speaker.pause)
+            await self._call(_PAUSE)
             logger.info("Sonos paused on power off")
         except Exception as e:
             logger.warning("Sonos pause failed: %s", e)
 
+    def _get_speaker(self):
+        """Return the SoCo handle, importing soco on first use.
+
+        Only ever called on the speaker's worker thread, so the soco import
+        (requests, ifaddr, xmltodict, ...) stays off the event loop.
+        """
+        if self._speaker is None:
+            from soco import SoCo
+            self._speaker = SoCo(self._ip)
+        return self._speaker
+
+    def _invoke(self, fn, *args):
+        return fn(self._get_speaker(), *args)
+
+    async def _call(self, fn, *args):
+        """Run ``fn(speaker, *args)`` on the speaker's worker, tracking failures.
+
+        A call that outlives _CALL_TIMEOUT counts as a failure.  The worker
+        thread itself stays busy until SoCo's own request timeout, but the
+        caller is released and the breaker soon stops queueing behind it.
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            result = await asyncio.wait_for(
+                loop.run_in_executor(self._executor, self._invoke, fn, *args),
+                timeout=_CALL_TIMEOUT)
+        except Exception:
+            self._fail_count += 1
+            if self._fail_count >= _BREAKER_THRESHOLD:
+                if loop.time() >= self._open_until:
+                    logger.warning("Sonos %s failed %d times, pausing calls for %.0fs",
+                                   self._ip, self._fail_count, _BREAKER_COOLDOWN)
+                self._open_until = loop.time() + _BREAKER_COOLDOWN
+            raise
+        self._fail_count = 0
+        self._open_until = 0.0
+        return result
+
+    def observe_volume(self, volume: float) -> None:
+        # The Sonos player service already follows the speaker's volume;
+        # reuse its reports rather than subscribing to RenderingControl here.
+        self._last_applied = int(volume)
+        self._last_applied_at = asyncio.get_running_loop().time()
+
+    async def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def is_on_cached(self) -> bool | None:
+        return True
+
     async def is_on(self) -> bool:
         return True  # Sonos is always on
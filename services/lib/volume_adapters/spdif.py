@@ -18,6 +18,9 @@ import os
 
 from .local import LocalVolume
 
+_DEFAULT_CARD = os.getenv("ALSA_CARD", "sndrpihifiberry")
+_DEFAULT_CONTROL = os.getenv("ALSA_CONTROL", "Playback")
+
 
 class SpdifVolume(LocalVolume):
     """Volume control via ALSA software mixer on S/PDIF HAT."""
@@ -26,7 +29,7 @@ class SpdifVolume(LocalVolume):
                  control: str | None = None):
         super().__init__(
             max_volume,
-            card=card or os.getenv("ALSA_CARD", "sndrpihifiberry"),
-            control=control or os.getenv("ALSA_CONTROL", "Playback"),
+            card=card or _DEFAULT_CARD,
+            control=control or _DEFAULT_CONTROL,
             label="S/PDIF",
         )
@@ -43,7 +43,8 @@ import aiohttp
 import asyncio
 from aiohttp import web
 from datetime import datetime
-from collections import defaultdict
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 
 # Ensure services/ is on the path for sibling imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -62,7 +63,7 @@ from lib.masterlink_provider import (
 )
 from lib.watchdog import watchdog_loop
 
-logger = install_logging('beo-masterlink')
+logger = install_logging('beo-masterlink', queued=True)
 
 # Configuration variables
 BEOSOUND_DEVICE_NAME = cfg("device", default="BeoSound5c")
@@ -115,7 +116,7 @@ ML_LINK_SOURCES = (_ML_CFG.get("link") or {}).get("sources") or []
 
 # Message processing settings
 MESSAGE_TIMEOUT = 2.0  # Discard messages older than 2 seconds
-DEDUP_COMMANDS = ["volup", "voldown", "left", "right"]  # Commands to deduplicate
+DEDUP_COMMANDS = frozenset({"volup", "voldown", "left", "right"})  # Commands to deduplicate
 WEBHOOK_INTERVAL = 0.2  # Send webhook at least every 0.2 seconds for deduped commands
 MAX_QUEUE_SIZE = 10  # Maximum number of messages to keep in queue
 sys.stdout.reconfigure(line_buffering=True)
@@ -124,11 +125,22 @@ class MessageQueue:
     """Thread-safe queue with lossy behavior and deduplication."""
     def __init__(self, timeout=MESSAGE_TIMEOUT):
         self.lock = threading.Lock()
-        self.queue = []
+        self.queue = deque()
         self.timeout = timeout
         self.command_counts = defaultdict(int)  # For deduplication
         self.last_message_time = {}  # Track the last message time for each command
         self.last_webhook_time = {}  # Track the last webhook time for each command
+        # Oldest queued message per dedup'd command, so a held key updates
+        # it in place without scanning the queue.
+        self._by_command = {}
+
+    def _reindex(self):
+        """Rebuild _by_command after messages were dropped from the queue."""
+        self._by_command = {}
+        for msg in self.queue:
+            command = msg.get('key_name')
+            if command in DEDUP_COMMANDS:
+                self._by_command.setdefault(command, msg)
 
     def add(self, message):
         """Add a message to the queue with timestamp."""
@@ -138,60 +150,66 @@ class MessageQueue:
 
             command = message.get('key_name')
             if command in DEDUP_COMMANDS:
-                if command in self.last_message_time:
-                    if now - self.last_message_time[command] < self.timeout:
-                        self.command_counts[command] += 1
-
-                        # Throttle: emit one webhook per WEBHOOK_INTERVAL while a
-                        # dedup'd command is being held down.
-                        send_webhook_now = False
-                        if command not in self.last_webhook_time or (now - self.last_webhook_time[command] >= WEBHOOK_INTERVAL):
-                            send_webhook_now = True
-                            self.last_webhook_time[command] = now
-
-                        for existing_msg in self.queue:
-                            if existing_msg.get('key_name') == command:
-                                existing_msg['count'] = self.command_counts[command]
-                                existing_msg['timestamp'] = now
-
-                                if send_webhook_now:
-                                    webhook_msg = existing_msg.copy()
-                                    webhook_msg['force_webhook'] = True
-                                    webhook_msg['priority'] = True
-                                    self.queue.append(webhook_msg)
-
-                                return
+                existing_msg = self._by_command.get(command)
+                if (existing_msg is not None and command in self.last_message_time
+                        and now - self.last_message_time[command] < self.timeout):
+                    self.command_counts[command] += 1
+                    existing_msg['count'] = self.command_counts[command]
+                    existing_msg['timestamp'] = now
+
+                    # Throttle: emit one webhook per WEBHOOK_INTERVAL while a
+                    # dedup'd command is being held down.
+                    if command not in self.last_webhook_time or (now - self.last_webhook_time[command] >= WEBHOOK_INTERVAL):
+                        self.last_webhook_time[command] = now
+                        webhook_msg = existing_msg.copy()
+                        webhook_msg['force_webhook'] = True
+                        webhook_msg['priority'] = True
+                        self.queue.append(webhook_msg)
+                    return
 
                 self.last_message_time[command] = now
                 self.last_webhook_time[command] = now
                 self.command_counts[command] = 1
                 message['count'] = 1
+                self._by_command.setdefault(command, message)
 
             self.queue.append(message)
 
-            # Bound queue size, keeping priority messages and newest non-priority.
-            if len(self.queue) > MAX_QUEUE_SIZE:
-                priority_msgs = [msg for msg in self.queue if msg.get('priority', False)]
-                non_priority_msgs = [msg for msg in self.queue if not msg.get('priority', False)]
-                non_priority_msgs.sort(key=lambda x: x.get('timestamp', 0), reverse=True)
-                keep_count = max(0, MAX_QUEUE_SIZE - len(priority_msgs))
-                self.queue = priority_msgs + non_priority_msgs[:keep_count]
+            # Bound queue size: drop the oldest non-priority messages.
+            excess = len(self.queue) - MAX_QUEUE_SIZE
+            if excess > 0:
+                kept = deque()
+                for msg in self.queue:
+                    if excess and not msg.get('priority', False):
+                        excess -= 1
+                        continue
+                    kept.append(msg)
+                self.queue = kept
+                self._reindex()
 
     def get(self):
         """Get the next valid message from the queue."""
         with self.lock:
             now = time.time()
-            self.queue = [msg for msg in self.queue if now - msg['timestamp'] < self.timeout]
+            if any(now - msg['timestamp'] >= self.timeout for msg in self.queue):
+                self.queue = deque(msg for msg in self.queue
+                                   if now - msg['timestamp'] < self.timeout)
+                self._reindex()
 
             if not self.queue:
                 return None
 
-            message = self.queue.pop(0)
+            message = self.queue.popleft()
 
             # Reset dedup bookkeeping once the last instance of this command drains.
             command = message.get('key_name')
-            if command in DEDUP_COMMANDS:
-                if all(msg.get('key_name') != command for msg in self.queue):
+            if self._by_command.get(command) is message:
+                following = next((msg for msg in self.queue
+                                  if msg.get('key_name') == command), None)
+                if following is not None:
+                    self._by_command[command] = following
+                else:
+                    del self._by_command[command]
                     self.command_counts[command] = 0
                     self.last_message_time.pop(command, None)
                     self.last_webhook_time.pop(command, None)
@@ -212,6 +230,10 @@ class PC2Device:
     # USB endpoints
     EP_OUT = 0x01  # For sending data to device
     EP_IN = 0x81   # For receiving data from device (LIBUSB_ENDPOINT_IN | 1)
+    # Bytes requested per IN read.  A read completes on the first short
+    # packet, so a large buffer costs nothing for a lone keypress but
+    # lets an ML burst (several frames back-to-back) arrive in one read.
+    RX_READ_SIZE = 16384
 
     # Default ML bus identity — overridden in __init__ based on ML_ROLE.
     # master   = 0xC1 AUDIO_MASTER (matches the 0xF6 filter and the PC2's
@@ -236,11 +258,13 @@ class PC2Device:
         self.running = False
         self.connected = False
         self.message_queue = MessageQueue()
+        self._wakeup = None  # asyncio.Event on the sender loop, set on enqueue
         self.sniffer_thread = None
         self.sender_thread = None
         self.session = None
         self.loop = None
         self._background_tasks = BackgroundTaskSet(logger, label="masterlink")
+        self._led_pulse_task = None  # at most one LED pulse request in flight
         self.mixer_state = {
             'speakers_on': False,
             'muted': False,
@@ -263,12 +287,17 @@ class PC2Device:
         self._vol_lock = threading.Lock()  # serialize step-based volume changes
         # Serializes USB TX across the three threads that send frames:
         # the sniffer thread (ML role replies), the sender-loop thread
-        # (clock broadcasts), and default-executor threads (mixer HTTP).
+        # (clock broadcasts), and the mixer HTTP worker (_usb_executor).
         # Held per-frame in send_message and across the multi-frame
         # sequences whose ordering libpc2 warns about ("the PC2 crashing
         # very hard if this is fudged").  RLock so sequences can nest
         # (audio_on → set_routing → send_message).
         self._tx_lock = threading.RLock()
+        # Mixer HTTP handlers run their USB sequences on this one thread,
+        # in arrival order, instead of the shared default executor where
+        # a 350 ms audio_on could tie up workers other blocking calls need.
+        self._usb_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="pc2-tx")
         # Track unknown USB message types we've already logged at INFO so
         # recurring background heartbeats (e.g. type 0x01, 0x1C every ~30s
         # on Church) don't flood the journal.
@@ -355,10 +384,18 @@ class PC2Device:
             time.sleep(0.1)
             self.send_message([0x80, 0x01, 0x00])
 
+    # Pre-framed 0xEB volume steps; set_volume writes these in a tight loop.
+    _TX_VOL_UP = bytes((0x60, 0x02, 0xEB, 0x80, 0x61))
+    _TX_VOL_DOWN = bytes((0x60, 0x02, 0xEB, 0x81, 0x61))
+
     def send_message(self, message):
         """Send a message to the device"""
-        telegram = [0x60, len(message)] + list(message) + [0x61]
-        logger.debug("Sending: %s", " ".join([f"{x:02X}" for x in telegram]))
+        self._write_telegram(bytes((0x60, len(message), *message, 0x61)))
+
+    def _write_telegram(self, telegram):
+        """Write an already-framed (0x60 LEN ... 0x61) telegram."""
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Sending: %s", telegram.hex(" ").upper())
         with self._tx_lock:
             dev = self.dev
             if dev is None:
@@ -412,7 +449,7 @@ class PC2Device:
                 continue
 
             try:
-                data = self.dev.read(self.EP_IN, 1024, timeout=500)
+                data = self.dev.read(self.EP_IN, self.RX_READ_SIZE, timeout=500)
                 if not data:
                     continue
                 rx_buffer.extend(data)
@@ -437,7 +474,7 @@ class PC2Device:
                         del rx_buffer[0]
                         continue
 
-                    message = list(rx_buffer[:frame_len])
+                    message = bytes(rx_buffer[:frame_len])
                     del rx_buffer[:frame_len]
                     self._process_usb_frame(message)
             except usb.core.USBTimeoutError:
@@ -458,7 +495,6 @@ class PC2Device:
 
     def _process_usb_frame(self, message):
         """Dispatch one fully-framed USB message (0x60 LEN ... 0x61)."""
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]
         msg_type = message[2] if len(message) > 2 else None
 
         if self.sniff_mode:
@@ -472,9 +508,11 @@ class PC2Device:
             self.mixer_state['volume'] = vol
             logger.debug("Mixer feedback: volume=%d", vol)
         elif msg_type == 0x02:
+            timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]
             msg_data = self.process_beo4_keycode(timestamp, message)
             if msg_data and self._ir_passes_filter(msg_data):
                 self.message_queue.add(msg_data)
+                self._notify_sender()
         elif msg_type == 0x00:
             self._log_ml_telegram(message)
         elif msg_type is not None:
@@ -521,10 +559,13 @@ class PC2Device:
     async def _init_session(self):
         """Initialize aiohttp session for router and LED pulse."""
         try:
+            # Every endpoint is on localhost, so resolve it once rather than
+            # every ttl_dns_cache seconds on a new connection.
             connector = aiohttp.TCPConnector(
                 limit=5,
                 keepalive_timeout=60,
                 force_close=False,
+                ttl_dns_cache=None,
             )
             self.session = aiohttp.ClientSession(
                 connector=connector,
@@ -537,27 +578,39 @@ class PC2Device:
             logger.error("Failed to initialize session: %s", e, exc_info=True)
             raise
 
+    def _notify_sender(self):
+        """Wake the sender loop (safe to call from any thread)."""
+        if self._wakeup is not None and self.loop is not None and not self.loop.is_closed():
+            self.loop.call_soon_threadsafe(self._wakeup.set)
+
     async def _async_sender_loop(self):
-        """Asynchronous background thread to process messages from the queue and send them"""
+        """Send queued messages to the router, sleeping until one is enqueued."""
+        self._wakeup = asyncio.Event()
+        self._wakeup.set()  # drain anything queued before the event existed
         while self.running:
             try:
-                message = self.message_queue.get()
-
-                if message:
-                    tasks = [self._send_webhook_async(message)]
-                    await asyncio.gather(*tasks, return_exceptions=True)
-
-                await asyncio.sleep(0.001)
+                await self._wakeup.wait()
+                self._wakeup.clear()
+                while self.running:
+                    message = self.message_queue.get()
+                    if message is None:
+                        break
+                    await self._send_webhook_async(message)
 
             except Exception as e:
                 logger.error("Error in sender loop: %s", e, exc_info=True)
                 await asyncio.sleep(0.1)
+                self._wakeup.set()  # retry what is left in the queue
 
     async def _send_webhook_async(self, message):
         """Send a message to the router service."""
         # Visual feedback: pulse LED on button press (fire-and-forget).
         # Tracked so exceptions land in the journal instead of vanishing.
-        self._background_tasks.spawn(self._pulse_led(), name="pulse_led")
+        # Single-flight: during key repeat a pulse is already showing, so
+        # presses that arrive while one is in flight don't start another.
+        if self._led_pulse_task is None or self._led_pulse_task.done():
+            self._led_pulse_task = self._background_tasks.spawn(
+                self._pulse_led(), name="pulse_led")
 
         webhook_data = {
             'device_name': BEOSOUND_DEVICE_NAME,
@@ -566,7 +619,8 @@ class PC2Device:
             'action': message.get('key_name', ''),
             'device_type': message.get('device_type', ''),
             'count': message.get('count', 1),
-            'timestamp': datetime.now().isoformat()
+            # Stamped by MessageQueue.add() when the press was queued
+            'timestamp': datetime.fromtimestamp(message['timestamp']).isoformat()
         }
 
         try:
@@ -606,142 +660,142 @@ class PC2Device:
             return False
         return True
 
-    def process_beo4_keycode(self, timestamp, data):
-        """Process and display a received Beo4 keycode USB message"""
-        hex_data = " ".join([f"{x:02X}" for x in data])
+    # Beo4 decode tables.  Link/source (data[3])
+    _BEO4_LINKS = {
+        0x00: "Beo4",
+        0x05: "BeoSound 8",
+        0x80: "link",
+    }
 
-        # Beo4 link/source mapping (data[3])
-        link_map = {
-            0x00: "Beo4",
-            0x05: "BeoSound 8",
-            0x80: "link",
-        }
+    # Device type (data[4])
+    _BEO4_DEVICE_TYPES = {
+        0x00: "Video",
+        0x01: "Audio",
+        0x05: "Vmem",
+        0x0F: "All",
+        0x1B: "Light"
+    }
 
-        # Device type mapping
-        device_type_map = {
-            0x00: "Video",
-            0x01: "Audio",
-            0x05: "Vmem",
-            0x0F: "All",
-            0x1B: "Light"
-        }
+    # Keycode (data[6])
+    # Reference: B&O MLGW protocol + own hardware testing
+    _BEO4_KEYS = {
+        # Digits
+        0x00: "0", 0x01: "1", 0x02: "2", 0x03: "3", 0x04: "4",
+        0x05: "5", 0x06: "6", 0x07: "7", 0x08: "8", 0x09: "9",
+        # Power / standby
+        0x0C: "off",
+        0x0D: "mute",
+        0x0F: "alloff",
+        # Source control (arrow keys on non-joystick, joystick in MODE 3)
+        0x1E: "up", 0x1F: "down",
+        0x32: "left", 0x33: "return", 0x34: "right",
+        0x35: "go", 0x36: "stop",
+        0x37: "record", 0x38: "shift-stop",
+        # 0x53 is the Beo4 PLAY button (distinct from GO at 0x35), and
+        # it's also what the BeoLab 2000 panel emits on its own PLAY
+        # press.  Mapped to "go" so the router toggles play/pause —
+        # matches user expectation of press-once-pause / press-again-
+        # resume.  The router action "play" is "resume only" which
+        # doesn't toggle, so go is the better fit here.
+        0x53: "go",
+        # Cursor (joystick in MODE 1)
+        0xCA: "cursor_up", 0xCB: "cursor_down",
+        0xCC: "cursor_left", 0xCD: "cursor_right",
+        0x13: "select",
+        # Navigation
+        0x7F: "back",
+        0x58: "list",
+        0x5C: "menu",
+        0x20: "track",
+        0x40: "guide",
+        0x43: "info",
+        # Volume
+        0x60: "volup", 0x64: "voldown",
+        # Sound / picture
+        0x2A: "format",
+        0x44: "speaker",
+        0x46: "sound",
+        0xF7: "stand",
+        0xDA: "cinema_on", 0xDB: "cinema_off",
+        0xAD: "2d", 0xAE: "3d",
+        0x1C: "p.mute",
+        # Sources — audio
+        0x81: "radio",
+        0x91: "amem",
+        0x92: "cd",
+        0x93: "n.radio",
+        0x94: "n.music",
+        0x95: "server",
+        0x96: "spotify",
+        0x97: "join",
+        # Sources — video
+        0x80: "tv",
+        0x82: "v.aux",
+        0x83: "a.aux",
+        0x84: "media",
+        0x85: "vmem",
+        0x86: "dvd",
+        0x87: "camera",
+        0x88: "text",
+        0x8A: "dtv",
+        0x8B: "pc",
+        0x8C: "youtube",
+        0x8D: "doorcam",
+        0x8E: "photo",
+        0x90: "usb2",
+        0xBF: "av",
+        0xFA: "p-in-p",
+        # Color keys
+        0xD4: "yellow", 0xD5: "green", 0xD8: "blue", 0xD9: "red",
+        # Shift combos
+        0x17: "shift-cd",
+        0x22: "shift-play",
+        0x24: "shift-goto",
+        0x28: "clock",
+        0xC0: "edit",
+        0xC1: "random",
+        0xC2: "shift-2",
+        0xC3: "repeat",
+        0xC4: "shift-4",
+        0xC5: "shift-5",
+        0xC6: "shift-6",
+        0xC7: "shift-7",
+        0xC8: "shift-8",
+        0xC9: "shift-9",
+        # Other
+        0x0A: "clear",
+        0x0B: "store",
+        0x0E: "reset",
+        0x14: "back2",
+        0x15: "mots",
+        0x2D: "eject",
+        0x3F: "select2",
+        0x47: "sleep",
+        0x4B: "app",
+        0x9B: "light",
+        0x9C: "command",
+        0xF2: "mots2",
+        # Repeat/hold codes
+        0x70: "rewind_repeat", 0x71: "wind_repeat",
+        0x72: "step_up_repeat", 0x73: "step_down_repeat",
+        0x75: "go_repeat",
+        0x76: "green_repeat", 0x77: "yellow_repeat",
+        0x78: "blue_repeat", 0x79: "red_repeat",
+        0x7E: "key_release",
+    }
 
-        # Key mapping (Beo4 IR keycodes)
-        # Reference: B&O MLGW protocol + own hardware testing
-        key_map = {
-            # Digits
-            0x00: "0", 0x01: "1", 0x02: "2", 0x03: "3", 0x04: "4",
-            0x05: "5", 0x06: "6", 0x07: "7", 0x08: "8", 0x09: "9",
-            # Power / standby
-            0x0C: "off",
-            0x0D: "mute",
-            0x0F: "alloff",
-            # Source control (arrow keys on non-joystick, joystick in MODE 3)
-            0x1E: "up", 0x1F: "down",
-            0x32: "left", 0x33: "return", 0x34: "right",
-            0x35: "go", 0x36: "stop",
-            0x37: "record", 0x38: "shift-stop",
-            # 0x53 is the Beo4 PLAY button (distinct from GO at 0x35), and
-            # it's also what the BeoLab 2000 panel emits on its own PLAY
-            # press.  Mapped to "go" so the router toggles play/pause —
-            # matches user expectation of press-once-pause / press-again-
-            # resume.  The router action "play" is "resume only" which
-            # doesn't toggle, so go is the better fit here.
-            0x53: "go",
-            # Cursor (joystick in MODE 1)
-            0xCA: "cursor_up", 0xCB: "cursor_down",
-            0xCC: "cursor_left", 0xCD: "cursor_right",
-            0x13: "select",
-            # Navigation
-            0x7F: "back",
-            0x58: "list",
-            0x5C: "menu",
-            0x20: "track",
-            0x40: "guide",
-            0x43: "info",
-            # Volume
-            0x60: "volup", 0x64: "voldown",
-            # Sound / picture
-            0x2A: "format",
-            0x44: "speaker",
-            0x46: "sound",
-            0xF7: "stand",
-            0xDA: "cinema_on", 0xDB: "cinema_off",
-            0xAD: "2d", 0xAE: "3d",
-            0x1C: "p.mute",
-            # Sources — audio
-            0x81: "radio",
-            0x91: "amem",
-            0x92: "cd",
-            0x93: "n.radio",
-            0x94: "n.music",
-            0x95: "server",
-            0x96: "spotify",
-            0x97: "join",
-            # Sources — video
-            0x80: "tv",
-            0x82: "v.aux",
-            0x83: "a.aux",
-            0x84: "media",
-            0x85: "vmem",
-            0x86: "dvd",
-            0x87: "camera",
-            0x88: "text",
-            0x8A: "dtv",
-            0x8B: "pc",
-            0x8C: "youtube",
-            0x8D: "doorcam",
-            0x8E: "photo",
-            0x90: "usb2",
-            0xBF: "av",
-            0xFA: "p-in-p",
-            # Color keys
-            0xD4: "yellow", 0xD5: "green", 0xD8: "blue", 0xD9: "red",
-            # Shift combos
-            0x17: "shift-cd",
-            0x22: "shift-play",
-            0x24: "shift-goto",
-            0x28: "clock",
-            0xC0: "edit",
-            0xC1: "random",
-            0xC2: "shift-2",
-            0xC3: "repeat",
-            0xC4: "shift-4",
-            0xC5: "shift-5",
-            0xC6: "shift-6",
-            0xC7: "shift-7",
-            0xC8: "shift-8",
-            0xC9: "shift-9",
-            # Other
-            0x0A: "clear",
-            0x0B: "store",
-            0x0E: "reset",
-            0x14: "back2",
-            0x15: "mots",
-            0x2D: "eject",
-            0x3F: "select2",
-            0x47: "sleep",
-            0x4B: "app",
-            0x9B: "light",
-            0x9C: "command",
-            0xF2: "mots2",
-            # Repeat/hold codes
-            0x70: "rewind_repeat", 0x71: "wind_repeat",
-            0x72: "step_up_repeat", 0x73: "step_down_repeat",
-            0x75: "go_repeat",
-            0x76: "green_repeat", 0x77: "yellow_repeat",
-            0x78: "blue_repeat", 0x79: "red_repeat",
-            0x7E: "key_release",
-        }
+    def process_beo4_keycode(self, timestamp, data):
+        """Process and display a received Beo4 keycode USB message"""
+        hex_data = bytes(data).hex(" ").upper()
 
         # Parse link, mode and keycode
         link = data[3]
         mode = data[4]
         keycode = data[6]
 
-        link_name = link_map.get(link, f"Unknown(0x{link:02x})")
-        device_type = device_type_map.get(mode, f"Unknown(0x{mode:02x})")
-        key_name = key_map.get(keycode, f"Unknown(0x{keycode:02x})")
+        link_name = self._BEO4_LINKS.get(link) or f"Unknown(0x{link:02x})"
+        device_type = self._BEO4_DEVICE_TYPES.get(mode) or f"Unknown(0x{mode:02x})"
+        key_name = self._BEO4_KEYS.get(keycode) or f"Unknown(0x{keycode:02x})"
 
         logger.info("[%s] [%s] %s -> %s", timestamp, link_name, device_type, key_name)
 
@@ -1027,9 +1081,9 @@ class PC2Device:
             diff = target - current
             if diff == 0:
                 return
-            direction = [0xeb, 0x80] if diff > 0 else [0xeb, 0x81]
+            step = self._TX_VOL_UP if diff > 0 else self._TX_VOL_DOWN
             for _ in range(abs(diff)):
-                self.send_message(direction)
+                self._write_telegram(step)
                 time.sleep(0.02)
             # Update both tracked and confirmed so queued requests don't
             # re-step from a stale baseline (USB feedback may lag).
@@ -1120,13 +1174,17 @@ class PC2Device:
         logger.warning("Mixer command failed: %s", e)
         return web.json_response({'ok': False, 'error': str(e)}, status=503)
 
+    async def _run_usb(self, fn, *args):
+        """Run a blocking USB TX sequence on the mixer worker thread."""
+        return await asyncio.get_running_loop().run_in_executor(
+            self._usb_executor, fn, *args)
+
     async def _handle_mixer_volume(self, request):
         """POST /mixer/volume  {"volume": 0-70}"""
         data = await request.json()
         vol = int(data.get('volume', 0))
-        loop = asyncio.get_running_loop()
         try:
-            await loop.run_in_executor(None, self.set_volume, vol)
+            await self._run_usb(self.set_volume, vol)
         except RuntimeError as e:
             return self._mixer_unavailable(e)
         return web.json_response({
@@ -1139,13 +1197,12 @@ class PC2Device:
         """POST /mixer/power  {"on": true/false, "volume": optional}"""
         data = await request.json()
         on = data.get('on', False)
-        loop = asyncio.get_running_loop()
         try:
             if on:
                 vol = data.get('volume', None)
-                await loop.run_in_executor(None, self.audio_on, vol)
+                await self._run_usb(self.audio_on, vol)
             else:
-                await loop.run_in_executor(None, self.audio_off)
+                await self._run_usb(self.audio_off)
         except RuntimeError as e:
             return self._mixer_unavailable(e)
         return web.json_response({'ok': True, 'speakers_on': on})
@@ -1154,9 +1211,8 @@ class PC2Device:
         """POST /mixer/mute  {"muted": true/false}"""
         data = await request.json()
         muted = data.get('muted', False)
-        loop = asyncio.get_running_loop()
         try:
-            await loop.run_in_executor(None, self.speaker_mute, muted)
+            await self._run_usb(self.speaker_mute, muted)
         except RuntimeError as e:
             return self._mixer_unavailable(e)
         return web.json_response({'ok': True, 'muted': muted})
@@ -1175,10 +1231,9 @@ class PC2Device:
         rooms won't auto-tune unless something else on ML advertises us."""
         data = await request.json()
         on = bool(data.get('on', False))
-        loop = asyncio.get_running_loop()
         try:
-            await loop.run_in_executor(
-                None, self.set_routing,
+            await self._run_usb(
+                self.set_routing,
                 self.mixer_state['local'], on, self.mixer_state['from_ml'])
         except RuntimeError as e:
             return self._mixer_unavailable(e)
@@ -1218,8 +1273,7 @@ class PC2Device:
             self._schedule_tone_save()
 
         # Best-effort: also push to PC2 via 0xE3 with the current volume.
-        loop = asyncio.get_running_loop()
-        await loop.run_in_executor(None, self._push_e3)
+        await self._run_usb(self._push_e3)
 
         return web.json_response({'ok': True, 'applied': applied,
                                   'state': {
@@ -1478,10 +1532,9 @@ class PC2Device:
                 {'ok': False, 'error': '"source_byte" must be an int'},
                 status=400)
 
-        loop = asyncio.get_running_loop()
         try:
-            await loop.run_in_executor(
-                None, self._role.request_source, source_byte)
+            await self._run_usb(
+                self._role.request_source, source_byte)
         except RuntimeError as e:
             return web.json_response(
                 {'ok': False, 'error': str(e)}, status=503)
@@ -1499,9 +1552,8 @@ class PC2Device:
         confirm against a sniffer when validating on new hardware.
         """
         try:
-            loop = asyncio.get_running_loop()
-            await loop.run_in_executor(
-                None, self.send_ml_telegram,
+            await self._run_usb(
+                self.send_ml_telegram,
                 0x83,                 # ALL_LINK_DEVICES
                 self.OUR_NODE_ID,
                 0x0A,                 # COMMAND
@@ -1531,9 +1583,8 @@ class PC2Device:
         """
         data = await request.json()
         try:
-            loop = asyncio.get_running_loop()
-            await loop.run_in_executor(
-                None, self.send_ml_telegram,
+            await self._run_usb(
+                self.send_ml_telegram,
                 int(data['dest_node']),
                 int(data['src_node']),
                 int(data['telegram_type']),
@@ -1578,6 +1629,7 @@ class PC2Device:
     def stop_sniffing(self):
         """Stop the USB sniffer"""
         self.running = False
+        self._notify_sender()  # let the sender loop see running=False
 
         # Clean up mixer HTTP server
         if self.loop and self._mixer_runner:
@@ -1597,6 +1649,7 @@ class PC2Device:
             self.sniffer_thread.join(timeout=1.0)
         if self.sender_thread:
             self.sender_thread.join(timeout=1.0)
+        self._usb_executor.shutdown(wait=False)
 
     def close(self):
         """Close the device"""
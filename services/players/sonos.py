@@ -54,6 +54,12 @@ def _patched_canonical_uri(self, uri):
 
 AppleMusicShare.canonical_uri = _patched_canonical_uri
 
+# Optional libuv-backed event loop; plain asyncio works the same, just slower.
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 # Ensure services/ is on the path for sibling imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from lib.config import cfg
@@ -64,6 +70,7 @@ from lib.timings import USER_ACTION_HORIZON
 # Configuration
 SONOS_IP = cfg("player", "ip", default="192.168.0.190")
 POLL_INTERVAL = 0.5  # seconds between change checks (fast for responsive track changes)
+IDLE_POLL_INTERVAL = 3.0  # ceiling the poll backs off to while nothing is playing
 PREFETCH_COUNT = 5  # number of upcoming tracks to prefetch
 
 
@@ -149,6 +156,10 @@ class SonosArtworkViewer:
 
         return self._cached_coordinator
 
+    def invalidate_coordinator(self):
+        """Force the next get_coordinator() call to re-resolve the group."""
+        self._cached_coordinator = None
+
     def get_current_track_info(self):
         """Get current track information from Sonos player or its coordinator."""
         try:
@@ -163,13 +174,14 @@ class SonosArtworkViewer:
             logger.error(f"Error getting track info: {e}")
             return None
 
-    def get_artwork_url(self, track_info=None):
+    def get_artwork_url(self, track_info=None, coordinator=None):
         """Get the artwork URL for the currently playing track.
 
         Pass the ``track_info`` dict already in hand when available —
         re-fetching makes a second blocking SoCo round-trip, and on rapid
         skips the two snapshots can straddle a track change, pairing
-        track N's title with track N+1's artwork.
+        track N's title with track N+1's artwork.  Likewise ``coordinator``
+        saves resolving the group again for relative art URLs.
         """
         if track_info is None:
             track_info = self.get_current_track_info()
@@ -182,7 +194,8 @@ class SonosArtworkViewer:
             return None
 
         if artwork_url.startswith('/'):
-            coordinator = self.get_coordinator()
+            if coordinator is None:
+                coordinator = self.get_coordinator()
             coordinator_ip = coordinator.ip_address
             artwork_url = f"http://{coordinator_ip}:1400{artwork_url}"
 
@@ -238,27 +251,26 @@ class SonosArtworkViewer:
 
         logger.info(f"Prefetching artwork for {len(urls)} upcoming tracks")
 
-        async with aiohttp.ClientSession() as session:
-            tasks = []
-            for position, url in urls:
-                if self._player and url in self._player._artwork_cache:
-                    logger.debug(f"Track {position} artwork already cached")
-                    continue
-                tasks.append(self._prefetch_single(session, position, url))
+        tasks = []
+        for position, url in urls:
+            if self._player and url in self._player._artwork_cache:
+                logger.debug(f"Track {position} artwork already cached")
+                continue
+            tasks.append(self._prefetch_single(position, url))
 
-            if tasks:
-                try:
-                    await asyncio.wait_for(
-                        asyncio.gather(*tasks, return_exceptions=True),
-                        timeout=15.0
-                    )
-                except asyncio.TimeoutError:
-                    logger.warning("Prefetch timed out, some tracks may not be cached")
-
-    async def _prefetch_single(self, session, position, url):
+        if tasks:
+            try:
+                await asyncio.wait_for(
+                    asyncio.gather(*tasks, return_exceptions=True),
+                    timeout=15.0
+                )
+            except asyncio.TimeoutError:
+                logger.warning("Prefetch timed out, some tracks may not be cached")
+
+    async def _prefetch_single(self, position, url):
         """Prefetch a single artwork URL."""
         try:
-            result = await self.fetch_artwork_async(url, session=session)
+            result = await self.fetch_artwork_async(url)
             if result:
                 logger.debug(f"Prefetched artwork for track {position}")
             else:
@@ -297,6 +309,12 @@ class MediaServer(PlayerBase):
         self._sonos_devices: dict[str, str] = {}   # player_name → ip
         self._default_player_playing: bool = False
         self._default_player_task: asyncio.Task | None = None
+        # Set by BS5c commands so an idle (backed-off) monitor polls now.
+        self._poll_wakeup = asyncio.Event()
+
+    def _stamp_command(self):
+        super()._stamp_command()
+        self._poll_wakeup.set()
 
     # ── PlayerBase abstract methods (SoCo playback commands) ──
 
@@ -1313,10 +1331,15 @@ class MediaServer(PlayerBase):
             logger.warning(f"Could not determine coordinator status: {e}")
 
         consecutive_failures = 0
+        idle_polls = 0
+        position_at = 0.0  # monotonic time self._current_position was read
         while self.running:
             try:
                 loop = asyncio.get_running_loop()
-                coordinator = self.sonos_viewer.get_coordinator()
+                # Resolving the group is a SOAP call every 30 s (or after an
+                # invalidation) — keep it off the event loop.
+                coordinator = await loop.run_in_executor(
+                    executor, self.sonos_viewer.get_coordinator)
                 local = self.sonos_viewer.sonos
 
                 # Fetch track info, transport state, and volume in parallel.
@@ -1328,8 +1351,25 @@ class MediaServer(PlayerBase):
                         if local else _resolved(None),
                     return_exceptions=True,
                 )
+                polled_at = time.monotonic()
+                if isinstance(transport_result, Exception) and coordinator is not local:
+                    # The cached coordinator may have left the group or gone
+                    # offline — re-resolve next poll rather than keep asking
+                    # it until the 30 s refresh.
+                    self.sonos_viewer.invalidate_coordinator()
+                    coordinator = None
                 transport_info = transport_result if not isinstance(transport_result, Exception) else {}
                 vol = vol_result if not isinstance(vol_result, Exception) else None
+                # Reused by fetch_media_data on a change this cycle; a failed
+                # transport poll (or dropped coordinator) stays None so it is
+                # retried there.
+                polled = {
+                    'coordinator': coordinator,
+                    'track_info': track_info,
+                    'transport_info': None if isinstance(transport_result, Exception)
+                                      else transport_result,
+                    'volume': vol,
+                }
 
                 # Process transport state and detect play/stop transitions
                 try:
@@ -1386,7 +1426,12 @@ class MediaServer(PlayerBase):
                         try:
                             current_seconds = self.time_to_seconds(self._current_position)
                             new_seconds = self.time_to_seconds(position)
-                            expected_seconds = current_seconds + POLL_INTERVAL
+                            # Measure the real gap: polls back off while idle
+                            # and a slow SoCo call stretches the cycle.  A
+                            # paused track doesn't advance at all.
+                            expected_seconds = current_seconds
+                            if self._current_playback_state == 'playing':
+                                expected_seconds += polled_at - position_at
 
                             if abs(new_seconds - expected_seconds) > 5:
                                 position_jumped = True
@@ -1435,7 +1480,7 @@ class MediaServer(PlayerBase):
                             self._pending_broadcast_attempts = 0
                         else:
                             logger.info(f"Detected change: {reason}")
-                            media_data = await self.fetch_media_data()
+                            media_data = await self.fetch_media_data(**polled)
                             if media_data:
                                 await self.broadcast_media_update(media_data, reason)
                                 self._pending_broadcast = False
@@ -1455,7 +1500,7 @@ class MediaServer(PlayerBase):
                     # override) — only the media update is owed.
                     elif self._pending_broadcast and not suppress:
                         self._pending_broadcast_attempts += 1
-                        media_data = await self.fetch_media_data()
+                        media_data = await self.fetch_media_data(**polled)
                         if media_data:
                             await self.broadcast_media_update(media_data, 'track_change')
                             self._pending_broadcast = False
@@ -1474,12 +1519,26 @@ class MediaServer(PlayerBase):
                             name="playback_override")
 
                     self._current_position = position
+                    position_at = polled_at
 
                 if consecutive_failures:
                     logger.info("Sonos reachable again after %d failed polls",
                                 consecutive_failures)
                     consecutive_failures = 0
-                await asyncio.sleep(POLL_INTERVAL)
+
+                # Nothing playing and no recent BS5c command: back off
+                # towards IDLE_POLL_INTERVAL.  External starts (Sonos app)
+                # are then seen within a few seconds; our own commands set
+                # _poll_wakeup and get the fast poll straight away.
+                if (self._current_playback_state == 'playing'
+                        or self._pending_broadcast
+                        or self.seconds_since_command() < USER_ACTION_HORIZON):
+                    idle_polls = 0
+                else:
+                    idle_polls += 1
+                await self._poll_sleep(
+                    min(POLL_INTERVAL * (2 ** min(idle_polls, 4)), IDLE_POLL_INTERVAL)
+                    if idle_polls else POLL_INTERVAL)
 
             except Exception as e:
                 # Back off while the speaker is unreachable. With the shipped
@@ -1497,13 +1556,32 @@ class MediaServer(PlayerBase):
                 await asyncio.sleep(
                     min(POLL_INTERVAL * (2 ** min(consecutive_failures, 6)), 30.0))
 
-    async def fetch_media_data(self):
-        """Fetch current media data including artwork."""
+    async def _poll_sleep(self, interval):
+        """Sleep until the next monitor poll, cut short by a BS5c command."""
+        try:
+            await asyncio.wait_for(self._poll_wakeup.wait(), timeout=interval)
+        except asyncio.TimeoutError:
+            pass
+        self._poll_wakeup.clear()
+
+    async def fetch_media_data(self, track_info=None, transport_info=None,
+                               volume=None, coordinator=None):
+        """Fetch current media data including artwork.
+
+        The monitor passes the coordinator/track/transport/volume it already
+        polled this cycle so a change broadcast doesn't repeat those SoCo
+        round trips; anything left as None is fetched here (off the loop).
+        """
         try:
             loop = asyncio.get_running_loop()
 
-            track_info = await loop.run_in_executor(
-                executor, self.sonos_viewer.get_current_track_info)
+            if coordinator is None:
+                coordinator = await loop.run_in_executor(
+                    executor, self.sonos_viewer.get_coordinator)
+
+            if track_info is None:
+                track_info = await loop.run_in_executor(
+                    executor, self.sonos_viewer.get_current_track_info)
             if not track_info:
                 logger.debug("No track info available")
                 return None
@@ -1525,7 +1603,7 @@ class MediaServer(PlayerBase):
                                  _k, _v)
                     return None
 
-            artwork_url = self.sonos_viewer.get_artwork_url(track_info)
+            artwork_url = self.sonos_viewer.get_artwork_url(track_info, coordinator)
             artwork_base64 = None
             artwork_size = None
 
@@ -1548,20 +1626,22 @@ class MediaServer(PlayerBase):
                                                       self._current_track_id),
                         name="artwork_retry")
 
-            coordinator = self.sonos_viewer.get_coordinator()
             actual_speaker = self.sonos_viewer.sonos
-            speaker_name = actual_speaker.player_name if actual_speaker else 'Unknown'
             speaker_ip = SONOS_IP
+            is_grouped = bool(coordinator and coordinator.ip_address != SONOS_IP)
 
-            is_grouped = False
-            coordinator_name = None
-            if coordinator and coordinator.ip_address != SONOS_IP:
-                is_grouped = True
-                coordinator_name = coordinator.player_name
+            # player_name reads SoCo's zone-group topology, which can mean a
+            # SOAP call — keep it off the event loop.
+            def _names():
+                return (actual_speaker.player_name if actual_speaker else 'Unknown',
+                        coordinator.player_name if is_grouped else None)
+            speaker_name, coordinator_name = await loop.run_in_executor(
+                executor, _names)
 
             try:
-                transport_info = await loop.run_in_executor(
-                    executor, coordinator.get_current_transport_info) if coordinator else {}
+                if transport_info is None:
+                    transport_info = await loop.run_in_executor(
+                        executor, coordinator.get_current_transport_info) if coordinator else {}
                 playback_state = transport_info.get('current_transport_state', 'STOPPED').lower()
                 if playback_state in ('playing', 'transitioning'):
                     state = 'playing'
@@ -1572,12 +1652,13 @@ class MediaServer(PlayerBase):
             except Exception:
                 state = 'unknown'
 
-            try:
-                local = self.sonos_viewer.sonos
-                volume = await loop.run_in_executor(
-                    executor, lambda: local.volume) if local else 0
-            except Exception:
-                volume = 0
+            if volume is None:
+                try:
+                    local = self.sonos_viewer.sonos
+                    volume = await loop.run_in_executor(
+                        executor, lambda: local.volume) if local else 0
+                except Exception:
+                    volume = 0
 
             media_data = {
                 'title': track_info.get('title', '—'),
@@ -1625,4 +1706,7 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
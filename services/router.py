@@ -26,6 +26,12 @@ import sys
 import aiohttp
 from aiohttp import web
 
+# Optional libuv-backed event loop; plain asyncio works the same, just slower.
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 # Ensure services/ is on the path for sibling imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from lib.config import cfg
@@ -177,7 +183,19 @@ class EventRouter:
     # ── Lifecycle ──
 
     async def start(self):
+        # One pooled session shared by the volume adapter and all router ->
+        # service calls.  Keep-alive lets rapid volume steps reuse a socket,
+        # the DNS cache skips an mDNS lookup of beolab5-controller.local per
+        # request, and the per-host cap stops a burst from opening a socket
+        # per request against a single speaker.
+        connector = aiohttp.TCPConnector(
+            limit=32,
+            limit_per_host=8,
+            ttl_dns_cache=300,
+            keepalive_timeout=30,
+        )
         self._session = aiohttp.ClientSession(
+            connector=connector,
             timeout=aiohttp.ClientTimeout(total=2.0),
         )
         self._lydbro.setup()
@@ -223,6 +241,8 @@ class EventRouter:
         except (asyncio.TimeoutError, Exception) as e:
             logger.warning("Transport stop timeout/error: %s", e)
         await self.media.close_all()
+        if self._volume:
+            await self._volume.close()
         if self._session:
             await self._session.close()
             self._session = None
@@ -680,6 +700,7 @@ class EventRouter:
             logger.debug("Volume report ignored (%.2fs after local set): %.0f%%",
                          since, ui_volume)
             return
+        self._volume.observe_volume(volume)
         if round(ui_volume) == round(self.volume):
             return
         self.volume = max(0, min(100, ui_volume))
@@ -1388,4 +1409,5 @@ if __name__ == "__main__":
     app = create_app()
     web.run_app(app, host="0.0.0.0", port=ROUTER_PORT,
                 shutdown_timeout=5.0, access_log=None,
-                print=lambda msg: logger.info(msg))
+                print=lambda msg: logger.info(msg),
+                loop=uvloop.new_event_loop() if uvloop is not None else None)
@@ -126,3 +126,20 @@ async def test_middleware_survives_handler_exception(app):
         assert resp.status == 500
     finally:
         await client.close()
+
+
+def test_queued_logging_keeps_correlation_id(capsys):
+    root = logging.getLogger()
+    saved_handlers, saved_level = root.handlers[:], root.level
+    try:
+        log = correlation.install_logging("test-queued", queued=True)
+        correlation.set_id("abc12")
+        log.info("hello %s", "queue")
+        correlation._stop_listener()  # flushes the writer thread
+        err = capsys.readouterr().err
+        assert "[abc12] hello queue" in err
+    finally:
+        correlation._stop_listener()
+        correlation.set_id("-")
+        root.handlers[:] = saved_handlers
+        root.setLevel(saved_level)
@@ -163,7 +163,7 @@ class TestMediaRaceScenarios:
         ms = MediaState()
 
         class StuckWS:
-            async def send_str(self, msg):
+            async def send_frame(self, msg, opcode):
                 await asyncio.sleep(10)  # longer than send timeout
 
             async def close(self):
@@ -173,7 +173,7 @@ class TestMediaRaceScenarios:
             def __init__(self):
                 self.received = []
 
-            async def send_str(self, msg):
+            async def send_frame(self, msg, opcode):
                 self.received.append(msg)
 
             async def close(self):
@@ -197,6 +197,29 @@ class TestMediaRaceScenarios:
         assert fast in ms._ws_clients
         assert len(fast.received) == 1       # delivered
 
+    def test_broadcast_payload_round_trips_as_json(self):
+        import json
+        ms = MediaState()
+
+        class FastWS:
+            def __init__(self):
+                self.received = []
+
+            async def send_frame(self, msg, opcode):
+                self.received.append(msg)
+
+        ws = FastWS()
+        ms._ws_clients.add(ws)
+        data = {"title": "Café", "artwork": "data:image/jpeg;base64,AAAA",
+                7: "non-str key"}
+        asyncio.run(ms.broadcast("media_update", data))
+
+        assert json.loads(ws.received[0]) == {
+            "type": "media_update",
+            "data": {"title": "Café", "artwork": "data:image/jpeg;base64,AAAA",
+                     "7": "non-str key"},
+        }
+
     def test_external_playback_clears_stale_metadata(self):
         """When Sonos app starts playing, old metadata should be cleared."""
         ms = MediaState()
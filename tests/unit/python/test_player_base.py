@@ -18,12 +18,15 @@ been historically buggy:
 from __future__ import annotations
 
 import asyncio
+import base64
 import time
+from io import BytesIO
 from unittest.mock import patch
 
 import pytest
+from PIL import Image
 
-from lib.player_base import ArtworkCache, PlayerBase
+from lib.player_base import MAX_ARTWORK_DIM, ArtworkCache, PlayerBase, _process_image
 
 
 # ── ArtworkCache ─────────────────────────────────────────────────────
@@ -94,6 +97,32 @@ class TestArtworkCache:
         assert "c" in c
 
 
+# ── _process_image ───────────────────────────────────────────────────
+
+
+class TestProcessImage:
+    @staticmethod
+    def _encode(mode, size, fmt):
+        image = Image.new(mode, size)
+        buf = BytesIO()
+        image.save(buf, fmt)
+        return buf.getvalue()
+
+    def test_large_artwork_is_downscaled(self):
+        result = _process_image(self._encode("RGB", (2000, 1000), "JPEG"))
+        assert result["size"] == (MAX_ARTWORK_DIM, MAX_ARTWORK_DIM // 2)
+        decoded = Image.open(BytesIO(base64.b64decode(result["base64"])))
+        assert decoded.format == "JPEG"
+        assert decoded.size == result["size"]
+
+    def test_small_artwork_is_not_upscaled(self):
+        result = _process_image(self._encode("RGBA", (300, 200), "PNG"))
+        assert result["size"] == (300, 200)
+
+    def test_garbage_returns_none(self):
+        assert _process_image(b"not an image") is None
+
+
 # ── Minimal concrete PlayerBase subclass for tests ───────────────────
 
 
@@ -155,6 +184,51 @@ def _fake_request(body: dict):
     return _R()
 
 
+# ── fetch_artwork ────────────────────────────────────────────────────
+
+
+class _FakeArtSession:
+    """Just enough of aiohttp.ClientSession for fetch_artwork."""
+
+    closed = False
+
+    def __init__(self, body: bytes):
+        self.body = body
+        self.urls: list[str] = []
+
+    def get(self, url, timeout=None):
+        self.urls.append(url)
+        body = self.body
+
+        class _Resp:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+            def raise_for_status(self):
+                pass
+
+            async def read(self):
+                return body
+
+        return _Resp()
+
+
+class TestFetchArtwork:
+    def test_defaults_to_player_session(self):
+        p = _FakePlayer()
+        p._http_session = _FakeArtSession(
+            TestProcessImage._encode("RGB", (64, 64), "JPEG"))
+
+        result = _run(p.fetch_artwork("http://art/1.jpg"))
+
+        assert result["size"] == (64, 64)
+        assert p._http_session.urls == ["http://art/1.jpg"]
+        assert "http://art/1.jpg" in p._artwork_cache
+
+
 # ── action_ts gating ─────────────────────────────────────────────────
 
 
@@ -255,6 +329,35 @@ class TestStaleRejection:
         assert p.stop_calls == 1
 
 
+class TestSimpleCommands:
+    def test_pause_does_not_read_body(self):
+        p = _FakePlayer()
+
+        class _NoBody:
+            async def json(self):
+                raise AssertionError("pause must not read the body")
+
+        resp = _run(p._handle_pause(_NoBody()))
+        assert "ok" in resp.text
+        assert p.pause_calls == 1
+
+    def test_next_records_action_ts(self):
+        p = _FakePlayer()
+        resp = _run(p._handle_next(_fake_request({"action_ts": 300.0})))
+        assert "ok" in resp.text
+        assert p._latest_action_ts == 300.0
+
+    def test_failed_command_reports_error(self):
+        p = _FakePlayer()
+
+        async def _fail():
+            return False
+
+        p.prev_track = _fail
+        resp = _run(p._handle_prev(_fake_request({})))
+        assert "error" in resp.text
+
+
 # ── Monitor suppression clock ────────────────────────────────────────
 
 
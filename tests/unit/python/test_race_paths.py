@@ -64,7 +64,7 @@ class TestMediaRaces:
         """Adding a client mid-broadcast must not raise set-size-changed.
 
         We simulate a client that, while being sent to, causes another
-        client to be added to the set from inside its send_str().  If the
+        client to be added to the set from inside its send_frame().  If the
         broadcast iterated the live set, Python would raise
         RuntimeError('Set changed size during iteration').
         """
@@ -72,10 +72,10 @@ class TestMediaRaces:
         added_during_send = []
 
         class MutatingWS:
-            async def send_str(self, msg):
+            async def send_frame(self, msg, opcode):
                 # Mutate the parent set while being sent to.
                 class Quiet:
-                    async def send_str(self, _msg):
+                    async def send_frame(self, _msg, opcode):
                         added_during_send.append(1)
 
                     async def close(self):
@@ -94,7 +94,7 @@ class TestMediaRaces:
         ms = MediaState()
 
         class ClosingWS:
-            async def send_str(self, msg):
+            async def send_frame(self, msg, opcode):
                 raise ConnectionResetError("client went away")
 
             async def close(self):
@@ -104,7 +104,7 @@ class TestMediaRaces:
             def __init__(self):
                 self.received = 0
 
-            async def send_str(self, msg):
+            async def send_frame(self, msg, opcode):
                 self.received += 1
 
             async def close(self):
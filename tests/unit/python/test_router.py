@@ -179,6 +179,7 @@ class TestVolumeReportCooldown:
             await router.report_volume(55)
             assert router.volume == 55
             router.media.broadcast.assert_awaited()
+            router._volume.observe_volume.assert_called_once_with(55)
 
         asyncio.run(run())
 
@@ -305,3 +305,19 @@ class TestStateBroadcast:
         _run(self._run_state_transition(p, 'paused', 'stopped'))
 
         assert p.broadcast_media_update.await_count == 0
+
+
+class TestIdlePoll:
+    def test_command_cuts_idle_sleep_short(self, sonos_player):
+        """A BS5c command must not wait out a backed-off idle poll."""
+        p = sonos_player
+
+        async def go():
+            loop = asyncio.get_running_loop()
+            loop.call_later(0.05, p._stamp_command)
+            start = time.monotonic()
+            await p._poll_sleep(5.0)
+            return time.monotonic() - start
+
+        assert _run(go()) < 1.0
+        assert not p._poll_wakeup.is_set()
@@ -0,0 +1,184 @@
+"""Tests for lib/file_playback/transcode_cache.py.
+
+ffmpeg is never spawned: ``_transcode`` is replaced with a fake that
+writes a fixed-size output file, so the tests pin the cache bookkeeping
+(prefetch admission and concurrency) rather than the encoder.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+SERVICES_DIR = Path(__file__).resolve().parents[3] / "services"
+sys.path.insert(0, str(SERVICES_DIR))
+
+from lib.file_playback import transcode_cache as tc_mod  # noqa: E402
+from lib.file_playback.transcode_cache import TranscodeCache  # noqa: E402
+
+
+def _run(coro):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+def _make_cache(tmp_path, max_bytes=10_000, size=1000):
+    cache = TranscodeCache(target_format='mp3', max_bytes=max_bytes)
+    cache._cache_dir = tmp_path
+    cache.calls = []
+    cache.running = 0
+    cache.peak = 0
+    cache.broken = set()
+
+    async def fake_transcode(input_path, output_path):
+        cache.calls.append(input_path)
+        cache.running += 1
+        cache.peak = max(cache.peak, cache.running)
+        await asyncio.sleep(0.01)
+        cache.running -= 1
+        if input_path in cache.broken:
+            return None
+        Path(output_path).write_bytes(b"x" * size)
+        return size
+
+    cache._transcode = fake_transcode
+    return cache
+
+
+async def _drain():
+    current = asyncio.current_task()
+    while True:
+        pending = [t for t in asyncio.all_tasks() if t is not current]
+        if not pending:
+            return
+        await asyncio.gather(*pending)
+
+
+class TestNeedsTranscode:
+    def test_mp3_target(self):
+        cache = TranscodeCache(target_format='mp3')
+        assert cache.needs_transcode("/music/a.wma")
+        assert cache.needs_transcode("/music/a.FLAC")
+        assert not cache.needs_transcode("/music/a.MP3")
+        assert not cache.needs_transcode("/music/a.ogg")
+
+    def test_flac_target_passes_flac(self):
+        cache = TranscodeCache(target_format='flac')
+        assert not cache.needs_transcode("/music/a.flac")
+        assert cache.needs_transcode("/music/a.wma")
+
+    def test_dot_in_directory_is_not_an_extension(self):
+        cache = TranscodeCache(target_format='mp3')
+        assert cache.needs_transcode("/music/Vol.mp3/track")
+
+
+class TestPrefetch:
+    def test_concurrency_is_bounded(self, tmp_path):
+        cache = _make_cache(tmp_path, max_bytes=10**9)
+        paths = [f"/music/t{i}.wma" for i in range(10)]
+
+        async def go():
+            await cache.prefetch(paths)
+            await _drain()
+
+        _run(go())
+        assert sorted(cache.calls) == sorted(paths)
+        assert cache.peak <= tc_mod.PREFETCH_CONCURRENCY
+
+    def test_passthrough_files_not_prefetched(self, tmp_path):
+        cache = _make_cache(tmp_path)
+
+        async def go():
+            await cache.prefetch(["/music/a.mp3", "/music/b.ogg"])
+            await _drain()
+
+        _run(go())
+        assert cache.calls == []
+
+    def test_skips_when_cache_full_of_recent_files(self, tmp_path):
+        cache = _make_cache(tmp_path, max_bytes=1000)
+        cache._record(str(tmp_path / "hot.mp3"), 2000)
+
+        async def go():
+            await cache.prefetch(["/music/next.wma"])
+            await _drain()
+
+        _run(go())
+        assert cache.calls == []
+
+    def test_prefetches_when_full_cache_is_stale(self, tmp_path):
+        cache = _make_cache(tmp_path, max_bytes=1000)
+        old = str(tmp_path / "old.mp3")
+        cache._record(old, 2000)
+        cache._lru[old] = (2000, time.monotonic() - tc_mod.PREFETCH_HOT_WINDOW - 10)
+
+        async def go():
+            await cache.prefetch(["/music/next.wma"])
+            await _drain()
+
+        _run(go())
+        assert cache.calls == ["/music/next.wma"]
+
+
+class TestFailedTranscodes:
+    def test_failure_is_not_retried(self, tmp_path):
+        cache = _make_cache(tmp_path)
+        cache.broken.add("/music/bad.wma")
+
+        async def go():
+            first = await cache.get_or_transcode("/music/bad.wma")
+            second = await cache.get_or_transcode("/music/bad.wma")
+            await cache.prefetch(["/music/bad.wma"])
+            await _drain()
+            return first, second
+
+        assert _run(go()) == (None, None)
+        assert cache.calls == ["/music/bad.wma"]
+
+    def test_failure_retried_after_ttl(self, tmp_path):
+        cache = _make_cache(tmp_path)
+        cache.broken.add("/music/bad.wma")
+        _run(cache.get_or_transcode("/music/bad.wma"))
+
+        cache.broken.clear()
+        cache._failed["/music/bad.wma"] -= tc_mod.FAILED_CACHE_TTL + 1
+        result = _run(cache.get_or_transcode("/music/bad.wma"))
+        assert result is not None
+        assert cache.calls == ["/music/bad.wma", "/music/bad.wma"]
+
+    def test_failed_cache_is_bounded(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(tc_mod, "FAILED_CACHE_SIZE", 2)
+        cache = _make_cache(tmp_path)
+        for name in ("a", "b", "c"):
+            cache._mark_failed(f"/music/{name}.wma")
+        assert list(cache._failed) == ["/music/b.wma", "/music/c.wma"]
+
+
+class TestEviction:
+    def test_evicts_least_recently_used(self, tmp_path):
+        cache = _make_cache(tmp_path, max_bytes=2500, size=1000)
+
+        async def go():
+            a = await cache.get_or_transcode("/music/a.wma")
+            b = await cache.get_or_transcode("/music/b.wma")
+            await cache.get_or_transcode("/music/a.wma")  # a is now newest
+            c = await cache.get_or_transcode("/music/c.wma")
+            return a, b, c
+
+        a, b, c = _run(go())
+        assert Path(a).is_file()
+        assert not Path(b).exists()
+        assert Path(c).is_file()
+        assert cache._total_bytes == 2000
+        assert list(cache._lru) == [a, c]
+
+    def test_oversized_newest_entry_is_kept(self, tmp_path):
+        cache = _make_cache(tmp_path, max_bytes=500, size=1000)
+        path = _run(cache.get_or_transcode("/music/big.wma"))
+        assert path is not None and Path(path).is_file()
+        assert cache._total_bytes == 1000
@@ -0,0 +1,714 @@
+"""Tests for lib/volume_adapters: factory dispatch and the HTTP/ALSA adapters.
+
+No hardware or network is touched — HTTP adapters get a fake session and
+ALSA adapters have their amixer runner replaced.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+from pathlib import Path
+
+import aiohttp
+import pytest
+
+SERVICES_DIR = Path(__file__).resolve().parents[3] / "services"
+sys.path.insert(0, str(SERVICES_DIR))
+
+from lib.volume_adapters import (  # noqa: E402
+    BeoLab5Volume,
+    BluesoundVolume,
+    C4AmpVolume,
+    HdmiVolume,
+    PowerLinkVolume,
+    RcaVolume,
+    SonosVolume,
+    SpdifVolume,
+    VolumeAdapter,
+    create_volume_adapter,
+)
+
+
+def _run(coro):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+class _FakeResponse:
+    def __init__(self, status=200, json_data=None, body=b""):
+        self.status = status
+        self._json = json_data or {}
+        self._body = body
+        self.content = _FakeStream(body)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def json(self, **kwargs):
+        return self._json
+
+    async def read(self):
+        return self._body
+
+    async def text(self):
+        return self._body.decode()
+
+    def raise_for_status(self):
+        pass
+
+
+class _FakeStream:
+    """Async line iterator standing in for ``resp.content``."""
+
+    def __init__(self, body):
+        self._lines = body.splitlines(keepends=True)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self._lines:
+            raise StopAsyncIteration
+        return self._lines.pop(0)
+
+
+class _FakeSession:
+    """Records (method, url, kwargs); answers from a url -> response map."""
+
+    def __init__(self, responses=None):
+        self.calls = []
+        self.responses = responses or {}
+
+    def _request(self, method, url, **kwargs):
+        self.calls.append((method, str(url), kwargs))
+        return self.responses.get(str(url), _FakeResponse())
+
+    def get(self, url, **kwargs):
+        return self._request("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self._request("POST", url, **kwargs)
+
+
+# ── Factory dispatch ─────────────────────────────────────────────────
+
+
+class TestCreateVolumeAdapter:
+    def test_explicit_types(self, mock_config):
+        cases = {
+            "hdmi": HdmiVolume,
+            "spdif": SpdifVolume,
+            "rca": RcaVolume,
+            "c4amp": C4AmpVolume,
+            "powerlink": PowerLinkVolume,
+            "beolab5": BeoLab5Volume,
+        }
+        for vol_type, cls in cases.items():
+            mock_config({"volume": {"type": vol_type, "host": "10.0.0.5"}})
+            assert type(create_volume_adapter(None)) is cls, vol_type
+
+    def test_unknown_type_falls_back_to_beolab5(self, mock_config):
+        mock_config({"volume": {"type": "banana"}})
+        adapter = create_volume_adapter(None)
+        assert isinstance(adapter, BeoLab5Volume)
+        assert adapter._host == "beolab5-controller.local"
+
+    def test_bluesound_defaults_to_player_ip(self, mock_config):
+        mock_config({"player": {"type": "bluesound", "ip": "192.168.1.40"}})
+        adapter = create_volume_adapter(None)
+        assert isinstance(adapter, BluesoundVolume)
+        assert adapter._ip == "192.168.1.40"
+
+    def test_every_adapter_reports_cached_power(self, mock_config):
+        for vol_type in ("hdmi", "spdif", "rca", "c4amp", "bluesound", "heos", "sonos"):
+            mock_config({"volume": {"type": vol_type, "host": "10.0.0.5"}})
+            adapter = create_volume_adapter(None)
+            assert adapter.is_on_cached() is _run(adapter.is_on()), vol_type
+
+    def test_powerlink_reads_mixer_settings(self, mock_config):
+        mock_config({"player": {"type": "local"},
+                     "volume": {"mixer_port": 9000, "default": 25, "max": 60}})
+        adapter = create_volume_adapter(None)
+        assert isinstance(adapter, PowerLinkVolume)
+        assert adapter._port == 9000
+        assert adapter._default_volume == 25
+        assert adapter._max_volume == 60
+
+
+# ── Debounced flush (VolumeAdapter base) ─────────────────────────────
+
+
+class _SlowAdapter(VolumeAdapter):
+    """Records every hardware write; each write takes ``delay`` seconds."""
+
+    def __init__(self, delay=0.05):
+        super().__init__(max_volume=100, debounce_ms=1)
+        self.delay = delay
+        self.applied = []
+
+    async def _apply_volume(self, volume):
+        self.applied.append(volume)
+        await asyncio.sleep(self.delay)
+
+    async def get_volume(self):
+        return self.applied[-1] if self.applied else None
+
+    async def is_on(self):
+        return True
+
+
+class TestDebouncedFlush:
+    def test_burst_during_inflight_write_collapses_to_latest(self):
+        adapter = _SlowAdapter(delay=0.2)
+
+        async def go():
+            await adapter.set_volume(10)
+            await asyncio.sleep(0.02)   # first write now in flight
+            for v in range(11, 31):
+                await adapter.set_volume(v)
+                await asyncio.sleep(0.002)
+            await asyncio.sleep(0.6)
+
+        _run(go())
+        assert adapter.applied == [10, 30]
+
+    def test_set_volume_does_not_wait_for_hardware(self):
+        adapter = _SlowAdapter(delay=5)
+
+        async def go():
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            await adapter.set_volume(10)
+            await asyncio.sleep(0.02)          # flush now stuck in a slow write
+            await adapter.set_volume(20)
+            elapsed = loop.time() - start
+            adapter._flush_task.cancel()
+            return elapsed
+
+        assert _run(go()) < 1
+        assert adapter.applied == [10]
+
+    def test_continuous_ticks_extend_the_debounce(self):
+        adapter = _SlowAdapter(delay=0)
+        adapter._debounce_ms = 30
+
+        async def go():
+            for v in range(10, 20):
+                await adapter.set_volume(v)
+                await asyncio.sleep(0.01)   # < debounce window
+            assert adapter.applied == []
+            await asyncio.sleep(0.1)
+
+        _run(go())
+        assert adapter.applied == [19]
+
+    def test_cap_applies_before_flush(self):
+        adapter = _SlowAdapter(delay=0)
+        adapter._max_volume = 50
+
+        async def go():
+            await adapter.set_volume(80)
+            await asyncio.sleep(0.02)
+
+        _run(go())
+        assert adapter.applied == [50]
+
+
+# ── PowerLink ────────────────────────────────────────────────────────
+
+
+class TestPowerLinkVolume:
+    def _adapter(self, speakers_on=True):
+        session = _FakeSession({
+            "http://localhost:8768/mixer/status":
+                _FakeResponse(json_data={"speakers_on": speakers_on, "volume": 30}),
+        })
+        return PowerLinkVolume("localhost", 70, 30, session), session
+
+    def test_is_on_cached_within_ttl(self):
+        adapter, session = self._adapter(speakers_on=True)
+
+        async def go():
+            return [await adapter.is_on() for _ in range(3)]
+
+        assert _run(go()) == [True, True, True]
+        assert len(session.calls) == 1
+
+    def test_power_off_refreshes_cache(self):
+        adapter, session = self._adapter(speakers_on=True)
+
+        async def go():
+            await adapter.power_off()
+            return await adapter.is_on()
+
+        assert _run(go()) is False
+        assert [c[0] for c in session.calls] == ["POST"]
+
+
+# ── BlueSound ────────────────────────────────────────────────────────
+
+
+class TestBluesoundVolume:
+    def _read(self, body):
+        session = _FakeSession({
+            "http://10.0.0.9:11000/Volume": _FakeResponse(body=body),
+        })
+        return _run(BluesoundVolume("10.0.0.9", 70, session).get_volume())
+
+    def test_parses_element_text(self):
+        body = b'<?xml version="1.0"?>\n<volume db="-23.5" mute="0" etag="4">32</volume>'
+        assert self._read(body) == 32.0
+
+    def test_falls_back_to_volume_attribute(self):
+        assert self._read(b'<status volume="17"/>') == 17.0
+
+
+# ── Sonos ────────────────────────────────────────────────────────────
+
+
+class _FakeSpeaker:
+    """Stands in for soco.SoCo: records volume writes, counts reads."""
+
+    def __init__(self, volume=20):
+        self._volume = volume
+        self.writes = []
+        self.reads = 0
+
+    @property
+    def volume(self):
+        self.reads += 1
+        return self._volume
+
+    @volume.setter
+    def volume(self, v):
+        self.writes.append(v)
+        self._volume = v
+
+    def pause(self):
+        pass
+
+
+class TestSonosVolume:
+    def _adapter(self, speaker=None):
+        adapter = SonosVolume("10.0.0.7", 70)
+        adapter._speaker = speaker or _FakeSpeaker()
+        return adapter, adapter._speaker
+
+    def test_speaker_built_lazily_on_worker(self, monkeypatch):
+        import threading
+        import types
+        built = []
+
+        def fake_soco(ip):
+            built.append((ip, threading.current_thread().name))
+            return _FakeSpeaker(volume=42)
+
+        monkeypatch.setitem(sys.modules, "soco", types.SimpleNamespace(SoCo=fake_soco))
+        adapter = SonosVolume("10.0.0.7", 70)
+        assert adapter._speaker is None and built == []
+        assert _run(adapter.get_volume()) == 42.0
+        assert built[0][0] == "10.0.0.7"
+        assert built[0][1].startswith("sonos-")
+
+    def test_repeated_level_is_not_rewritten(self):
+        adapter, speaker = self._adapter()
+
+        async def go():
+            await adapter._apply_volume(30.2)
+            await adapter._apply_volume(30.7)
+            await adapter._apply_volume(31)
+
+        _run(go())
+        assert speaker.writes == [30, 31]
+
+    def test_calls_run_on_the_speaker_worker(self):
+        import threading
+
+        class _Spy(_FakeSpeaker):
+            threads = []
+
+            def pause(self):
+                self.threads.append(threading.current_thread().name)
+
+        adapter, speaker = self._adapter(_Spy())
+
+        async def go():
+            await adapter.power_off()
+            await adapter.close()
+
+        _run(go())
+        assert speaker.threads[0].startswith("sonos-10.0.0.7")
+
+    def test_breaker_stops_calls_to_a_dead_speaker(self):
+        class _Dead(_FakeSpeaker):
+            @property
+            def volume(self):
+                self.reads += 1
+                raise OSError("no route to host")
+
+        adapter, speaker = self._adapter(_Dead())
+
+        async def go():
+            results = [await adapter.get_volume() for _ in range(5)]
+            adapter._open_until = 0.0        # cooldown over
+            results.append(await adapter.get_volume())
+            return results
+
+        assert _run(go()) == [None] * 6
+        assert speaker.reads == 4
+
+    def test_hung_call_times_out(self, monkeypatch):
+        import threading
+        import lib.volume_adapters.sonos as sonos_mod
+        monkeypatch.setattr(sonos_mod, "_CALL_TIMEOUT", 0.05)
+        release = threading.Event()
+
+        class _Hung(_FakeSpeaker):
+            @property
+            def volume(self):
+                release.wait(2)
+                return 10
+
+        adapter, _ = self._adapter(_Hung())
+        try:
+            assert _run(adapter.get_volume()) is None
+            assert adapter._fail_count == 1
+        finally:
+            release.set()
+
+    def test_player_report_refreshes_last_applied(self):
+        adapter, speaker = self._adapter()
+
+        async def go():
+            await adapter._apply_volume(30)
+            adapter.observe_volume(50)      # player service saw the app move it
+            await adapter._apply_volume(30)
+
+        _run(go())
+        assert speaker.writes == [30, 30]
+
+    def test_read_refreshes_last_applied(self):
+        adapter, speaker = self._adapter()
+
+        async def go():
+            await adapter._apply_volume(30)
+            speaker._volume = 50            # changed from the Sonos app
+            await adapter.get_volume()
+            await adapter._apply_volume(30)
+
+        _run(go())
+        assert speaker.writes == [30, 30]
+
+
+# ── Local ALSA (HDMI / S/PDIF / RCA) ─────────────────────────────────
+
+
+class _FakeALSAError(Exception):
+    pass
+
+
+class _FakeMixer:
+    def __init__(self, control, cardindex):
+        self.control = control
+        self.cardindex = cardindex
+        self.volume = 40
+        self.muted = 0
+
+    def setvolume(self, v):
+        self.volume = v
+
+    def getvolume(self):
+        return [self.volume, self.volume]
+
+    def setmute(self, m):
+        self.muted = m
+
+    def handleevents(self):
+        return 0
+
+
+class _FakeAlsa:
+    ALSAAudioError = _FakeALSAError
+
+    def __init__(self, cards):
+        self._cards = cards
+        self.mixers = []
+
+    def cards(self):
+        return list(self._cards)
+
+    def Mixer(self, control, cardindex):
+        m = _FakeMixer(control, cardindex)
+        self.mixers.append(m)
+        return m
+
+
+class TestLocalVolume:
+    def _adapter(self, monkeypatch, cards):
+        import lib.volume_adapters.local as local_mod
+        fake = _FakeAlsa(cards)
+        monkeypatch.setattr(local_mod, "alsaaudio", fake, raising=False)
+        monkeypatch.setattr(local_mod, "_HAS_ALSAAUDIO", True)
+        adapter = HdmiVolume(70, card="vc4hdmi1", control="PCM")
+        adapter.amixer_calls = []
+
+        async def fake_amixer(*args):
+            adapter.amixer_calls.append(args)
+            return "  Mono: Playback 52 [55%] [on]\n"
+
+        adapter._amixer = fake_amixer
+        return adapter, fake
+
+    def test_uses_in_process_mixer(self, monkeypatch):
+        adapter, fake = self._adapter(monkeypatch, ["vc4hdmi0", "vc4hdmi1"])
+
+        async def go():
+            await adapter._apply_volume(33.4)
+            await adapter.power_off()
+            return await adapter.get_volume()
+
+        assert _run(go()) == 33.0
+        assert len(fake.mixers) == 1
+        assert fake.mixers[0].cardindex == 1
+        assert fake.mixers[0].muted == 1
+        assert adapter.amixer_calls == []
+
+    def test_falls_back_to_amixer_when_card_missing(self, monkeypatch):
+        adapter, fake = self._adapter(monkeypatch, ["vc4hdmi0"])
+
+        async def go():
+            await adapter._apply_volume(20)
+            return await adapter.get_volume()
+
+        assert _run(go()) == 55.0
+        assert adapter.amixer_calls[0] == ("-q", "sset", "PCM", "20%")
+
+    def test_amixer_runs_against_configured_card(self, monkeypatch):
+        import lib.volume_adapters.local as local_mod
+        adapter = HdmiVolume(70, card="vc4hdmi1", control="PCM")
+        seen = []
+
+        class _Proc:
+            returncode = 0
+
+            async def communicate(self):
+                return b"  Mono: Playback 52 [55%] [on]\n", b""
+
+        async def fake_exec(*argv, **kwargs):
+            seen.append(argv)
+            return _Proc()
+
+        monkeypatch.setattr(local_mod.asyncio, "create_subprocess_exec", fake_exec)
+        out = _run(adapter._amixer("sset", "PCM", "20%"))
+        assert seen == [("amixer", "-c", "vc4hdmi1", "sset", "PCM", "20%")]
+        assert "[55%]" in out
+
+    def test_amixer_output_parsing(self, monkeypatch):
+        adapter, _ = self._adapter(monkeypatch, [])
+
+        async def fake_amixer(*args):
+            return ("Simple mixer control 'PCM',0\n"
+                    "  Capabilities: pvolume pswitch\n"
+                    "  Limits: Playback 0 - 255\n"
+                    "  Front Left: Playback 180 [71%] [on]\n"
+                    "  Front Right: Playback 180 [71%] [on]\n")
+
+        adapter._amixer = fake_amixer
+        assert _run(adapter.get_volume()) == 71.0
+
+    def test_amixer_output_without_percentage(self, monkeypatch):
+        adapter, _ = self._adapter(monkeypatch, [])
+
+        async def fake_amixer(*args):
+            return ""
+
+        adapter._amixer = fake_amixer
+        assert _run(adapter.get_volume()) == 0
+
+
+# ── BeoLab 5 ─────────────────────────────────────────────────────────
+
+
+class TestBeoLab5Volume:
+    def test_apply_volume_posts_to_controller(self):
+        session = _FakeSession()
+        adapter = BeoLab5Volume("bl5.local", 70, session)
+        _run(adapter._apply_volume(35))
+        method, url, kwargs = session.calls[0]
+        assert (method, url) == ("POST", "http://bl5.local/number/volume/set")
+        assert kwargs["params"] == {"value": "35"}
+
+    def test_apply_volume_sends_whole_percent(self):
+        session = _FakeSession()
+        adapter = BeoLab5Volume("bl5.local", 70, session)
+        _run(adapter._apply_volume(23.1))
+        assert session.calls[0][2]["params"] == {"value": "23"}
+
+    def test_is_on_reads_power_switch(self):
+        session = _FakeSession({
+            "http://bl5.local/switch/power": _FakeResponse(json_data={"value": True}),
+        })
+        adapter = BeoLab5Volume("bl5.local", 70, session)
+
+        async def go():
+            try:
+                return await adapter.is_on()
+            finally:
+                await adapter.close()
+
+        assert _run(go()) is True
+        assert adapter.is_on_cached() is True
+
+    def test_power_on_writes_safe_volume_without_debounce(self):
+        session = _FakeSession({
+            "http://bl5.local/number/volume": _FakeResponse(json_data={"value": 40}),
+            "http://bl5.local/events": _FakeResponse(status=404),
+        })
+        adapter = BeoLab5Volume("bl5.local", 70, session)
+        adapter._last_volume = 65
+
+        async def go():
+            try:
+                await adapter.power_on()
+            finally:
+                await adapter.close()
+
+        _run(go())
+        posts = [(url, kw.get("params")) for method, url, kw in session.calls
+                 if method == "POST"]
+        assert posts == [
+            ("http://bl5.local/switch/power/turn_on", None),
+            ("http://bl5.local/number/volume/set", {"value": "40"}),
+        ]
+        assert adapter._debounce_handle is None
+        assert adapter._last_volume == 40
+
+    def test_power_on_readback_with_live_events_keeps_safe_volume(self):
+        session = _FakeSession()
+        adapter = BeoLab5Volume("bl5.local", 70, session)
+        adapter._last_volume = 65
+        adapter._events_live = True
+        adapter._event_volume = 65                # pre-power-on level
+
+        async def go():
+            # Stand-in for an already-running stream subscription
+            adapter._events_task = asyncio.get_running_loop().create_future()
+            await adapter.power_on()
+
+        _run(go())
+        assert adapter._last_volume == 40
+        assert "http://bl5.local/number/volume" not in [c[1] for c in session.calls]
+
+    def test_unreachable_controller_is_logged_not_raised(self):
+        session = _FakeSession()
+
+        def refuse(method, url, **kwargs):
+            raise aiohttp.ClientConnectionError("refused")
+
+        session._request = refuse
+        adapter = BeoLab5Volume("bl5.local", 70, session)
+        _run(adapter._apply_volume(30))
+        assert _run(adapter.get_balance()) == 0
+
+    def test_programming_errors_are_not_swallowed(self):
+        session = _FakeSession()
+
+        def broken(method, url, **kwargs):
+            raise AttributeError("bug")
+
+        session._request = broken
+        adapter = BeoLab5Volume("bl5.local", 70, session)
+        with pytest.raises(AttributeError):
+            _run(adapter._apply_volume(30))
+
+    def test_event_stream_replaces_polling(self):
+        stream = (b"event: ping\ndata: {}\n\n"
+                  b'event: state\ndata: {"id":"switch-power","value":true,"state":"ON"}\n\n'
+                  b'event: state\ndata: {"id":"number/volume","value":27,"state":"27"}\n\n')
+        session = _FakeSession({"http://bl5.local/events": _FakeResponse(body=stream)})
+        adapter = BeoLab5Volume("bl5.local", 70, session)
+        adapter._power_cache_ttl = 0   # any cache hit must come from the stream
+
+        async def go():
+            await adapter.is_on()                  # starts the subscription
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+            adapter._events_live = True            # fake stream ended; pretend it is open
+            try:
+                return await adapter.is_on(), await adapter.get_volume()
+            finally:
+                await adapter.close()
+
+        session.calls.clear()
+        assert _run(go()) == (True, 27.0)
+        urls = [c[1] for c in session.calls]
+        assert urls.count("http://bl5.local/events") == 1
+        assert "http://bl5.local/number/volume" not in urls
+
+    def test_malformed_event_stream_reconnects(self):
+        stream = (b"event: state\ndata: [1, 2]\n\n"
+                  b'event: state\ndata: "switch-power"\n\n'
+                  b'event: state\ndata: {"id":"number-volume","value":12}\n\n')
+        session = _FakeSession({"http://bl5.local/events": _FakeResponse(body=stream)})
+        adapter = BeoLab5Volume("bl5.local", 70, session)
+
+        async def go():
+            adapter._ensure_events()
+            for _ in range(5):
+                await asyncio.sleep(0)
+            # Non-object payloads are skipped; the task is in its reconnect
+            # backoff rather than dead.
+            alive = not adapter._events_task.done()
+            await adapter.close()
+            return alive
+
+        assert _run(go()) is True
+        assert adapter._event_volume == 12.0
+
+    def test_stream_read_error_reconnects(self):
+        class _BadStream:
+            def __aiter__(self):
+                return self
+
+            async def __anext__(self):
+                raise ValueError("Chunk too big")
+
+        resp = _FakeResponse()
+        resp.content = _BadStream()
+        session = _FakeSession({"http://bl5.local/events": resp})
+        adapter = BeoLab5Volume("bl5.local", 70, session)
+
+        async def go():
+            adapter._ensure_events()
+            for _ in range(5):
+                await asyncio.sleep(0)
+            alive = not adapter._events_task.done()
+            await adapter.close()
+            return alive
+
+        assert _run(go()) is True
+        assert adapter._events_live is False
+
+    def test_missing_event_stream_keeps_polling(self):
+        session = _FakeSession({
+            "http://bl5.local/events": _FakeResponse(status=404),
+            "http://bl5.local/switch/power": _FakeResponse(json_data={"value": False}),
+        })
+        adapter = BeoLab5Volume("bl5.local", 70, session)
+
+        async def go():
+            await adapter.is_on()
+            await asyncio.sleep(0)
+            done = adapter._events_task.done()
+            await adapter.close()
+            return done
+
+        assert _run(go()) is True
+        assert adapter._events_live is False